@@ -1,34 +1,177 @@
+import argparse
+import logging
 import sys
-from resources.ec2 import main as ec2_main
-from resources.s3 import main as s3_main
-from resources.route53 import main as route53_main
 
-def main():
-    """The main() function serves as the entry point for the AWS Resource Management CLI.
-    It presents users with a menu of options to manage AWS resources, including EC2 instances, S3 buckets,
-    and Route 53 DNS records. Based on the user's input, the function calls the appropriate submodule (ec2_main(),
-    s3_main(), or route53_main()). If the user selects "Exit," the program terminates. In case of an invalid input,
-    an error message is displayed, prompting the user to enter a valid option.
+def _run_ec2(args=None):
+    """Loads the EC2 module only when EC2 management is requested and opens its menu."""
+    from resources.ec2 import main as ec2_main
+    ec2_main()
+
+def _run_ec2_list(args):
+    """Lists the instances created via the CLI."""
+    from resources.ec2 import list_cli_instances
+    list_cli_instances()
+
+def _run_ec2_start(args):
+    """Starts the instances given with --id in a single request."""
+    from resources.ec2 import change_instances_state
+    return change_instances_state("start", args.id)
+
+def _run_ec2_stop(args):
+    """Stops the instances given with --id in a single request."""
+    from resources.ec2 import change_instances_state
+    return change_instances_state("stop", args.id)
+
+def _run_ec2_delete(args):
+    """Terminates the instances given with --id, asking for confirmation unless --yes is passed."""
+    from resources.ec2 import terminate_instances
+
+    if not args.yes:
+        confirm = input(f"Are you sure you want to terminate instance {', '.join(args.id)}? (y/N): ").strip().lower()
+        if confirm != "y":
+            print("Termination cancelled.")
+            return False
+
+    return terminate_instances(args.id)
+
+def _run_ec2_create(args):
+    """Creates an instance from the --name, --ami and --type options."""
+    from resources.ec2 import AMI_CHOICES, INSTANCE_TYPE_CHOICES, check_running_instances, launch_instance
+
+    if not check_running_instances():
+        return False
+
+    return launch_instance(args.name, AMI_CHOICES[args.ami], INSTANCE_TYPE_CHOICES[args.type]) is not None
+
+def _run_s3(args=None):
+    """Loads the S3 module only when S3 management is requested and opens its menu."""
+    from resources.s3 import main as s3_main
+    s3_main()
+
+def _run_route53(args=None):
+    """Loads the Route 53 module only when DNS management is requested and opens its menu."""
+    from resources.route53 import main as route53_main
+    route53_main()
+
+def _run_route53_create_record(args):
+    """Creates (or updates) a DNS record in the CLI-created zone given with --zone."""
+    from resources.route53 import get_cli_zone, upsert_dns_record
+
+    zone = get_cli_zone(args.zone)
+    if not zone:
+        print(f"No CLI-created DNS zone named '{args.zone}' was found.")
+        return False
+
+    zone_id, zone_name = zone
+    return upsert_dns_record(zone_id, zone_name, args.name, args.type, args.value, args.ttl)
+
+def interactive_menu():
+    """The interactive_menu() function presents users with a menu of options to manage AWS resources, including
+    EC2 instances, S3 buckets, and Route 53 DNS records. Based on the user's input, the function calls the
+    appropriate submodule (ec2_main(), s3_main(), or route53_main()). If the user selects "Exit," the program
+    terminates. In case of an invalid input, an error message is displayed, prompting the user to enter a valid option.
     """
     print("\nAWS Resource Management CLI")
     print("1. Manage EC2 Instances")
     print("2. Manage S3 Buckets")
     print("3. Manage Route 53 DNS Records")
     print("4. Exit")
-    
+
     choice = input("\nEnter your choice (1-4): ").strip()
-    
+
     if choice == "1":
-        ec2_main()
+        _run_ec2()
     elif choice == "2":
-        s3_main()
+        _run_s3()
     elif choice == "3":
-        route53_main()
+        _run_route53()
     elif choice == "4":
         sys.exit()
     else:
         print("Invalid choice. Please enter a number between 1 and 4.")
 
+def _configure_logging():
+    """
+    Prints the status lines logged by the resource modules to stdout, like the rest of the CLI output.
+    Only the 'resources' loggers are configured, so library (e.g. botocore) messages stay hidden.
+    """
+    logger = logging.getLogger("resources")
+    if not logger.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+def build_parser():
+    """
+    Builds the command line parser. Every subcommand registers its handler with set_defaults(func=...),
+    and each handler imports its resource module only when it runs.
+    """
+    parser = argparse.ArgumentParser(description="AWS Resource Management CLI")
+    subparsers = parser.add_subparsers(dest="command")
+
+    ec2_parser = subparsers.add_parser("ec2", help="Manage EC2 instances")
+    ec2_parser.set_defaults(func=_run_ec2)
+
+    # Non-interactive EC2 commands, so the EC2 flow can be scripted
+    ec2_list_parser = subparsers.add_parser("ec2-list", help="List the EC2 instances created via the CLI")
+    ec2_list_parser.set_defaults(func=_run_ec2_list)
+
+    ec2_start_parser = subparsers.add_parser("ec2-start", help="Start EC2 instances")
+    ec2_start_parser.add_argument("--id", nargs="+", required=True, help="IDs of the instances to start")
+    ec2_start_parser.set_defaults(func=_run_ec2_start)
+
+    ec2_stop_parser = subparsers.add_parser("ec2-stop", help="Stop EC2 instances")
+    ec2_stop_parser.add_argument("--id", nargs="+", required=True, help="IDs of the instances to stop")
+    ec2_stop_parser.set_defaults(func=_run_ec2_stop)
+
+    ec2_delete_parser = subparsers.add_parser("ec2-delete", help="Terminate EC2 instances")
+    ec2_delete_parser.add_argument("--id", nargs="+", required=True, help="IDs of the instances to terminate")
+    ec2_delete_parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
+    ec2_delete_parser.set_defaults(func=_run_ec2_delete)
+
+    ec2_create_parser = subparsers.add_parser("ec2-create", help="Create an EC2 instance")
+    ec2_create_parser.add_argument("--name", required=True, help="Name tag of the new instance")
+    ec2_create_parser.add_argument("--ami", choices=["ubuntu", "amazon-linux"], required=True, help="AMI to launch")
+    ec2_create_parser.add_argument("--type", choices=["t3.nano", "t4g.nano"], required=True, help="Instance type")
+    ec2_create_parser.set_defaults(func=_run_ec2_create)
+
+    s3_parser = subparsers.add_parser("s3", help="Manage S3 buckets")
+    s3_parser.set_defaults(func=_run_s3)
+
+    route53_parser = subparsers.add_parser("route53", help="Manage Route 53 DNS records")
+    route53_parser.set_defaults(func=_run_route53)
+
+    # Non-interactive Route 53 commands, so records can be created from scripts
+    route53_record_parser = subparsers.add_parser("route53-create-record", help="Create or update a DNS record")
+    route53_record_parser.add_argument("--zone", required=True, help="Domain name of a CLI-created hosted zone")
+    route53_record_parser.add_argument("--name", default="", help="Record name (subdomain or full name, empty for the zone itself)")
+    route53_record_parser.add_argument("--type", type=str.upper, required=True,
+                                       choices=["A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "PTR", "SOA"],
+                                       help="Record type")
+    route53_record_parser.add_argument("--value", required=True, help="Record value")
+    route53_record_parser.add_argument("--ttl", type=int, default=300, help="TTL in seconds (default 300)")
+    route53_record_parser.set_defaults(func=_run_route53_create_record)
+
+    return parser
+
+def main(argv=None):
+    """The main() function serves as the entry point for the AWS Resource Management CLI.
+    When a subcommand is given, its handler is called directly without printing the menu,
+    and a handler reporting failure makes the CLI exit with status 1.
+    Otherwise the interactive menu is shown.
+    """
+    args = build_parser().parse_args(argv)
+
+    _configure_logging()
+
+    if getattr(args, "func", None):
+        if args.func(args) is False:
+            sys.exit(1)
+        return
+
+    interactive_menu()
+
 if __name__ == "__main__":
     main()
-    print("Exiting CLI. Goodbye!")
\ No newline at end of file
+    print("Exiting CLI. Goodbye!")
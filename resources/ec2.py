@@ -1,5 +1,100 @@
-import boto3
+import functools
+import sys
 from resources.config import *
+from resources.session import get_session
+from resources.output import write_lines
+
+# Every state except shutting-down and terminated
+_ACTIVE_STATES = ['pending', 'running', 'stopping', 'stopped']
+
+# The actions that can be performed on an instance, and the state the instance must be in for each
+_VALID_ACTIONS = frozenset({"start", "stop"})
+_REQUIRED_STATE = {"start": "stopped", "stop": "running"}
+
+@functools.lru_cache(maxsize=1)
+def _ec2_resource():
+    """
+    Returns the EC2 resource shared by every function in this module.
+    The resource is built from the shared session on first use, so importing this module does not load boto3.
+    """
+    return get_session().resource('ec2')
+
+@functools.lru_cache(maxsize=1)
+def _ec2_client():
+    """
+    Returns the low-level EC2 client behind the shared resource, for calls that don't need Instance objects.
+    """
+    return _ec2_resource().meta.client
+
+def _name_tag(tags, default="N/A"):
+    """
+    Returns the value of the Name tag from an instance's tag list.
+
+    :param tags: The instance tags (may be None for untagged instances)
+    :param default: The value returned when the instance has no Name tag
+    :return: The instance name
+    """
+    return {tag['Key']: tag['Value'] for tag in (tags or [])}.get('Name', default)
+
+def _describe_instance_pages(filters):
+    """
+    Yields the instances matching the given filters one DescribeInstances page at a time,
+    so callers can print rows as soon as the first page arrives.
+
+    :param filters: DescribeInstances filters
+    :return: Generator of lists of instance dictionaries
+    """
+    paginator = _ec2_client().get_paginator('describe_instances')
+    for page in paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 100}):
+        yield [instance for reservation in page['Reservations'] for instance in reservation['Instances']]
+
+def _describe_instances(filters):
+    """
+    Yields the instances matching the given filters as plain dictionaries, walking every page of DescribeInstances.
+
+    :param filters: DescribeInstances filters
+    :return: Generator of instance dictionaries
+    """
+    for page in _describe_instance_pages(filters):
+        yield from page
+
+def _instance_row(instance):
+    """
+    Reads the attributes the EC2 menus need from a DescribeInstances dictionary.
+
+    :return: (instance_id, state, public_ip, private_ip, name_tag) tuple
+    """
+    return (
+        instance['InstanceId'],
+        instance['State']['Name'].strip().lower(),
+        instance.get('PublicIpAddress', 'N/A'),
+        instance.get('PrivateIpAddress', 'N/A'),
+        _name_tag(instance.get('Tags'))
+    )
+
+def _looks_like_instance_id(value):
+    """
+    Checks whether the user's input has the shape of an EC2 instance ID (i- followed by 8 or 17 characters).
+    """
+    return value.startswith('i-') and len(value) in (10, 19)
+
+def _describe_instance_by_id(instance_id):
+    """
+    Fetches a single instance with DescribeInstances(InstanceIds=[...]).
+
+    :param instance_id: The ID of the instance
+    :return: The instance dictionary, or None if AWS does not know the ID
+    """
+    client = _ec2_client()
+
+    try:
+        response = client.describe_instances(InstanceIds=[instance_id])
+    except client.exceptions.ClientError as e:
+        if e.response['Error']['Code'] in ('InvalidInstanceID.NotFound', 'InvalidInstanceID.Malformed'):
+            return None
+        raise
+
+    return next((instance for reservation in response['Reservations'] for instance in reservation['Instances']), None)
 
 def get_valid_action():
     """
@@ -8,7 +103,7 @@ def get_valid_action():
     """
     action = input("Do you want to start or stop an instance? (start/stop): ").strip().lower()
     
-    while action not in ["start", "stop"]:
+    while action not in _VALID_ACTIONS:
         print("Invalid action. Please enter 'start' or 'stop': ")
         action = input().strip().lower()  
 
@@ -16,38 +111,51 @@ def get_valid_action():
 
 #CHECK IF THERE IS SAME NAME TO DIFFRENTE INSTANCES
 
-def get_instance_by_name(ec2, instance_name, filter_state=None):
+def get_instance_by_name(instance_name, filter_state=None):
     """
     Searches for EC2 instances by name (tag:Name) and allows the user to select one if multiple instances are found.
+    If the value looks like an instance ID, the instance is fetched directly by its ID instead.
     
-    :param ec2: boto3 resource object
-    :param instance_name: The name of the instance to search for
+    :param instance_name: The name (or ID) of the instance to search for
     :param filter_state: (Optional) The state of the instance (running/stopped)
-    :return: The selected EC2 instance object
+    :return: The selected instance as returned by DescribeInstances
     """
-    filters = [{'Name': 'tag:Name', 'Values': [instance_name]}]
-    if filter_state:
-        filters.append({'Name': 'instance-state-name', 'Values': [filter_state]})
+    states = [filter_state] if filter_state else _ACTIVE_STATES
 
-    instances = list(ec2.instances.filter(Filters=filters))
+    if _looks_like_instance_id(instance_name):
+        instance = _describe_instance_by_id(instance_name)
 
-    instances = [instance for instance in instances if instance.state['Name'] not in ["terminated", "shutting-down"]]
+        if not instance or instance['State']['Name'] not in states:
+            print(f" No instance found with ID '{instance_name}'.")
+            return None
+
+        return instance
+
+    filters = [
+        {'Name': 'tag:Name', 'Values': [instance_name]},
+        {'Name': 'instance-state-name', 'Values': states}
+    ]
+
+    instances = list(_describe_instances(filters))
 
     if not instances:
         print(f" No instances found with name '{instance_name}'.")
         return None
 
     if len(instances) > 1:
-        print(f"\n🔹 Multiple instances found with name '{instance_name}'. Please choose one:")
-        print(f"{'Instance ID':<20} {'State':<10} {'Public IP':<15} {'Private IP'}")
-        print("=" * 60)
+        lines = [
+            f"\n🔹 Multiple instances found with name '{instance_name}'. Please choose one:",
+            f"{'Instance ID':<20} {'State':<10} {'Public IP':<15} {'Private IP'}",
+            "=" * 60
+        ]
 
         for instance in instances:
-            name_tag = next((tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'), "N/A") if instance.tags else "N/A"
-            print(f"{instance.id:<20} {instance.state['Name']:<10} {str(instance.public_ip_address) if instance.public_ip_address else 'N/A':<15} {instance.private_ip_address}")
+            lines.append(f"{instance['InstanceId']:<20} {instance['State']['Name']:<10} {instance.get('PublicIpAddress', 'N/A'):<15} {instance.get('PrivateIpAddress', 'N/A')}")
+
+        write_lines(lines)
 
         instance_id = input("\nEnter the Instance ID you want to manage: ").strip()
-        instance = next((i for i in instances if i.id == instance_id), None)
+        instance = {i['InstanceId']: i for i in instances}.get(instance_id)
 
         if not instance:
             print(f" No instance found with ID '{instance_id}'. Operation cancelled.")
@@ -59,23 +167,33 @@ def get_instance_by_name(ec2, instance_name, filter_state=None):
 
 #CHECK FOR RUNNING INSTANCES
 
-def check_running_instances():
+def check_running_instances(running_list=None, requested=1):
     """
     Checks the number of running EC2 instances created via the CLI. 
     If the limit of running instances (e.g., 2) is reached, it prevents the creation or starting of new instances.
     
-    :return: True if a new instance can be created or started, False otherwise.
+    :param running_list: (Optional) Running instances already fetched by the caller, so no extra lookup is made
+    :param requested: The number of instances about to be created or started
+    :return: True if the new instances can be created or started, False otherwise.
     """
 
-    ec2 = boto3.resource('ec2', region_name=REGION_NAME)
-
-    # Searching for all the runnung instances
-    running_instances = list(ec2.instances.filter(
-        Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]
-    ))
+    # Counting the running instances (unless the caller already fetched them).
+    # Pages are read until the limit is reached or none are left; a filtered page can be short or empty
+    # while more results remain, so a single page isn't enough.
+    if running_list is None:
+        running_count = 0
+        for page in _describe_instance_pages([{'Name': 'instance-state-name', 'Values': ['running']}]):
+            running_count += len(page)
+            if running_count >= 2:
+                break
+    else:
+        running_count = len(running_list)
 
-    if len(running_instances) >= 2:
-        print("You already have 2 running instances. Cannot create or start more.")
+    if running_count + requested > 2:
+        if running_count >= 2:
+            print("You already have 2 running instances. Cannot create or start more.")
+        else:
+            print(f"You have {running_count} running instance(s). Starting {requested} more would exceed the limit of 2.")
         print("""Here is the list of all running instances:
                 |
                 v
@@ -90,113 +208,187 @@ def check_running_instances():
 
 #MANAGE EC2
 
+def _select_instance_row(instance_identifier, by_id, by_name):
+    """
+    Resolves one name or ID typed by the user against the instances listed by manage_ec2_instance.
+
+    The identifier is matched by ID first, then by Name tag. An ID that isn't listed is looked up directly,
+    so an instance in the wrong state is reported as such. If multiple instances have the same name,
+    the user is asked to select an Instance ID.
+
+    :param instance_identifier: The name or ID entered by the user
+    :param by_id: Listed instance rows indexed by instance ID
+    :param by_name: Lists of listed instance rows indexed by Name tag
+    :return: The selected instance row, or None if the operation is cancelled
+    """
+    if instance_identifier in by_id:
+        filtered_instances = [by_id[instance_identifier]]
+    elif _looks_like_instance_id(instance_identifier):
+        instance = _describe_instance_by_id(instance_identifier)
+        filtered_instances = [_instance_row(instance)] if instance else []
+    else:
+        filtered_instances = by_name.get(instance_identifier, [])
+
+    if not filtered_instances:
+        print(f" No instance found with Name or ID '{instance_identifier}'. Operation cancelled.")
+        return None
+
+    if len(filtered_instances) == 1:
+        return filtered_instances[0]
+
+    lines = [
+        f"\n🔹 Multiple instances found with name '{instance_identifier}'. Please choose one:",
+        f"{'Instance ID':<20} {'State':<10} {'Public IP':<15} {'Private IP'}",
+        "=" * 60
+    ]
+
+    for instance_id, state, public_ip, private_ip, name_tag in filtered_instances:
+        lines.append(f"{instance_id:<20} {state:<10} {public_ip:<15} {private_ip}")
+
+    write_lines(lines)
+
+    instance_id = input("\nEnter the Instance ID you want to manage: ").strip()
+    row = {r[0]: r for r in filtered_instances}.get(instance_id)
+
+    if not row:
+        print(f"No instance found with ID '{instance_id}'. Operation cancelled.")
+
+    return row
+
 def manage_ec2_instance():
     """
     Manages EC2 instances by allowing the user to start or stop an instance.
     The function first lists all available instances that can be managed,
     ensuring that only instances created via the CLI are included.
     
-    The user is prompted to select an instance by name or ID and choose an action.
-    If the instance is already in the desired state, no action is taken.
+    The user is prompted to choose an action and select one or more instances by name or ID
+    (comma-separated); the action is sent for all of them in a single request.
+    If an instance is not in the required state, no action is taken.
     
     Additional checks ensure that no more than two instances are running at a time.
     If the user attempts to start an instance while the limit is reached, the action is denied.
 
     Exceptions are handled to ensure a smooth user experience in case of AWS errors.
     """
-    ec2 = boto3.resource('ec2', region_name=REGION_NAME)
+    action = get_valid_action()
 
-    action = input("Do you want to start or stop an instance? (start/stop): ").strip().lower()
+    filter_state = _REQUIRED_STATE[action]
 
-    action = get_valid_action()
+    # Fetching running and stopped instances at once: the candidates for the action are printed
+    # as each page arrives and indexed by ID and name, and the running ones feed the limit check
+    running = []
+    by_id = {}
+    by_name = {}
 
-    # Searching for all instances that can have the action performed on them
-    filter_state = "stopped" if action == "start" else "running"
-    instances = list(ec2.instances.filter(
-        Filters=[{'Name': 'instance-state-name', 'Values': [filter_state]}]
-    ))
+    for i in _describe_instances([{'Name': 'instance-state-name', 'Values': ['running', 'stopped']}]):
+        row = _instance_row(i)
+        instance_id, state, public_ip, private_ip, name_tag = row
+
+        if state == "running":
+            running.append(row)
+        if state != filter_state:
+            continue
+
+        if not by_id:
+            print(f"\nAvailable instances to {action}:")
+            print(f"{'Instance ID':<20} {'Name':<15} {'Public IP':<15} {'Private IP'}")
+            print("=" * 60)
+
+        by_id[instance_id] = row
+        by_name.setdefault(name_tag, []).append(row)
+        print(f"{instance_id:<20} {name_tag:<15} {public_ip:<15} {private_ip}")
 
     # If there are no instances in the appropriate state – display a message and stop the operation
-    if not instances:
+    if not by_id:
         print(f"No {filter_state} instances available to {action}.")
         return
 
-    # Display a list of instances that can be started/stopped
-    print(f"\nAvailable instances to {action}:")
-    print(f"{'Instance ID':<20} {'Name':<15} {'Public IP':<15} {'Private IP'}")
-    print("=" * 60)
+    # Receive one or more `Instance ID`s or names from the user
+    identifiers = input("\nEnter the Instance Name(s) or Instance ID(s) to manage, separated by commas: ").split(",")
+    identifiers = [identifier.strip() for identifier in identifiers if identifier.strip()]
 
-    for instance in instances:
-        name_tag = next((tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'), "N/A") if instance.tags else "N/A"
-        print(f"{instance.id:<20} {name_tag:<15} {str(instance.public_ip_address) if instance.public_ip_address else 'N/A':<15} {instance.private_ip_address}")
+    if not identifiers:
+        print("No instance selected. Operation cancelled.")
+        return
 
-    # Receive `Instance ID` or name from the user
-    instance_identifier = input("\nEnter the Instance Name or Instance ID to manage: ").strip()
+    # Resolve every identifier, keeping each instance once
+    selected = {}
 
-    # Search by name (Name Tag)
-    filtered_instances = list(ec2.instances.filter(
-        Filters=[
-            {'Name': 'tag:Name', 'Values': [instance_identifier]},
-            {'Name': 'instance-state-name', 'Values': [filter_state]}
-        ]
-    ))
+    for instance_identifier in identifiers:
+        row = _select_instance_row(instance_identifier, by_id, by_name)
+        if not row:
+            return
 
-    # If not found by name, try searching by Instance ID
-    if not filtered_instances:
-        filtered_instances = list(ec2.instances.filter(
-            Filters=[{'Name': 'instance-id', 'Values': [instance_identifier]}]
-        ))
+        instance_id, instance_state = row[:2]
 
-    if not filtered_instances:
-        print(f" No instance found with Name or ID '{instance_identifier}'. Operation cancelled.")
-        return
+        # Check if the instance is in the correct state for the requested action
+        if instance_state != filter_state:
+            print(f"Instance {instance_id} is {instance_state}. Impossible to {action}.")
+            return
 
-    # If multiple instances have the same name, ask the user to select an Instance ID
-    if len(filtered_instances) > 1:
-        print(f"\n🔹 Multiple instances found with name '{instance_identifier}'. Please choose one:")
-        print(f"{'Instance ID':<20} {'State':<10} {'Public IP':<15} {'Private IP'}")
-        print("=" * 60)
+        selected[instance_id] = row
 
-        for instance in filtered_instances:
-            name_tag = next((tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'), "N/A") if instance.tags else "N/A"
-            print(f"{instance.id:<20} {instance.state['Name']:<10} {str(instance.public_ip_address) if instance.public_ip_address else 'N/A':<15} {instance.private_ip_address}")
+    change_instances_state(action, list(selected), running)
 
-        instance_id = input("\nEnter the Instance ID you want to manage: ").strip()
-        instance = next((i for i in filtered_instances if i.id == instance_id), None)
+#CHANGE THE STATE OF INSTANCES
 
-        if not instance:
-            print(f"No instance found with ID '{instance_id}'. Operation cancelled.")
-            return
-    else:
-        instance = filtered_instances[0]
+def change_instances_state(action, instance_ids, running_list=None):
+    """
+    Starts or stops the given instances with a single API request, without prompting the user.
+    When starting, the limit of running instances is checked first.
 
-    instance_id = instance.id
-    instance_state = instance.state['Name'].strip().lower()
+    :param action: "start" or "stop"
+    :param instance_ids: The IDs of the instances to start or stop
+    :param running_list: (Optional) Running instances already fetched by the caller
+    :return: True if the request succeeded, False otherwise.
+    """
+    instance_list = ", ".join(instance_ids)
 
     try:
-        # Check if the instance is in the correct state for the requested action
-        valid_states = {"start": "stopped", "stop": "running"}
+        # If starting instances, check the limit of running instances
+        if action == "start" and not check_running_instances(running_list, len(instance_ids)):
+            return False
 
-        if instance_state != valid_states[action]:
-            print(f"Instance {instance_id} is {instance_state}. Impossible to {action}.")
-            return
+        print(f"{action.capitalize()}ing instance {instance_list}...")
 
-        # If starting an instance, check the limit of running instances
-        if action == "start" and not check_running_instances():
-            return
+        # Perform the appropriate action on all the instances in a single request
+        client = _ec2_client()
+        actions = {"start": client.start_instances, "stop": client.stop_instances}
+        actions[action](InstanceIds=instance_ids)
+
+        print(f"Instance {instance_list} has been {action}ed successfully.")
+        return True
 
-        print(f"{action.capitalize()}ing instance {instance_id}...")
+    except Exception as e:
+        print(f"Failed to {action} instance {instance_list}: {e}")
+        return False
 
-        # Perform the appropriate action
-        getattr(instance, action)()
+#CREATE EC2
 
-        print(f"Instance {instance_id} has been {action}ed successfully.")
+def _choose(options, prompt, invalid_message):
+    """
+    Prompts until the user enters one of the given options, or 'q' to quit the program.
 
-    except Exception as e:
-        print(f"Failed to {action} instance {instance_id}: {e}")
+    :param options: The accepted inputs, mapped to the values they select
+    :param prompt: The prompt shown to the user
+    :param invalid_message: The message printed after an invalid input
+    :return: The value selected by the user
+    """
+    while True:
+        choice = input(prompt).strip().lower()
 
+        if choice in options:
+            return options[choice]
+        if choice == 'q':
+            print("Exiting program...")
+            sys.exit(0)
+
+        print(invalid_message)
+
+# The AMIs and instance types that can be chosen when creating an instance
+AMI_CHOICES = {"ubuntu": UBUNTU_AMI, "amazon-linux": AMAZON_LINUX_AMI}
+INSTANCE_TYPE_CHOICES = {"t3.nano": INSTANCE_TYPE_T3, "t4g.nano": INSTANCE_TYPE_T4G}
 
-#CREATE EC2
 def create_ec2_instance():
     """
     Creates a new EC2 instance with user-defined specifications.
@@ -215,40 +407,32 @@ def create_ec2_instance():
     if not check_running_instances():
         return    
 
-    ec2 = boto3.resource('ec2', region_name=REGION_NAME)
-    
-    while True:
-        image_choice = input("Enter instance AMI (press 'u' for Ubuntu, 'a' for Amazon Linux, or 'q' to quit): ").strip().lower()
-
-        if image_choice == 'a':
-            image_id = AMAZON_LINUX_AMI
-            break
-        elif image_choice == 'u':
-            image_id = UBUNTU_AMI
-            break
-        elif image_choice == 'q':
-            print("Exiting program...")
-            exit()
-        else:
-            print("Invalid input! Please enter 'u' for Ubuntu, 'a' for Amazon Linux, or 'q' to quit.")
+    image_id = _choose(
+        {'u': AMI_CHOICES["ubuntu"], 'a': AMI_CHOICES["amazon-linux"]},
+        "Enter instance AMI (press 'u' for Ubuntu, 'a' for Amazon Linux, or 'q' to quit): ",
+        "Invalid input! Please enter 'u' for Ubuntu, 'a' for Amazon Linux, or 'q' to quit."
+    )
 
-    while True:
-        type_choice = input("Enter instance type (press 't3' for Ubuntu, 't4' for Amazon Linux, or 'q' to quit): ").strip().lower()
-
-        if type_choice == 't3':
-            instance_type = INSTANCE_TYPE_T3
-            break
-        elif type_choice == 't4':
-            instance_type = INSTANCE_TYPE_T4G
-            break
-        elif type_choice == 'q':
-            print("Exiting program...")
-            exit()
-        else:
-            print("Invalid input! Please enter 't3' for t3.nano, 't4' for t4g.nano, or 'q' to quit.") 
+    instance_type = _choose(
+        {'t3': INSTANCE_TYPE_CHOICES["t3.nano"], 't4': INSTANCE_TYPE_CHOICES["t4g.nano"]},
+        "Enter instance type (press 't3' for Ubuntu, 't4' for Amazon Linux, or 'q' to quit): ",
+        "Invalid input! Please enter 't3' for t3.nano, 't4' for t4g.nano, or 'q' to quit."
+    )
 
+    return launch_instance(instance_name, image_id, instance_type)
+
+def launch_instance(instance_name, image_id, instance_type):
+    """
+    Launches one tagged EC2 instance without prompting the user.
+    The caller is responsible for checking the limit of running instances.
+
+    :param instance_name: The value of the instance's Name tag
+    :param image_id: The AMI to launch
+    :param instance_type: The EC2 instance type
+    :return: The created instance ID if successful, None otherwise.
+    """
     try:
-        instances = ec2.create_instances(
+        instances = _ec2_resource().create_instances(
             ImageId=image_id,
             MinCount=1,
             MaxCount=1,
@@ -280,6 +464,7 @@ def create_ec2_instance():
     except Exception as e:
         print(f"Failed to create instance: {e}")
         return None
+
 #DELETE EC2
 
 def delete_instance():
@@ -287,115 +472,141 @@ def delete_instance():
     Deletes an EC2 instance based on user input.
     
     - Displays a list of available instances that can be deleted.
-    - Asks the user to enter the instance name to delete.
+    - Asks the user to enter the instance names or IDs to delete (comma-separated).
     - If multiple instances exist with the same name, allows the user to select the correct one by Instance ID.
     - Confirms the deletion with the user before proceeding.
-    - Sends a termination request to AWS for the selected instance.
+    - Sends a single termination request to AWS for all the selected instances.
     - Displays success or failure messages based on the termination result.
 
     :return: None
     """
-    ec2 = boto3.resource('ec2', region_name=REGION_NAME)
+    # Show all the available instances to delete as each page arrives
+    count = 0
 
-    instances = list(ec2.instances.filter(
-        Filters=[{'Name': 'instance-state-name', 'Values': ['running', 'stopped']}]
-    ))
+    for instance in _describe_instances([{'Name': 'instance-state-name', 'Values': ['running', 'stopped']}]):
+        if not count:
+            print("\nAvailable instances to delete:")
+            print(f"{'Instance ID':<20} {'Name':<20} {'State':<10} {'Public IP':<15} {'Private IP'}")
+            print("=" * 80)
+
+        count += 1
+        name_tag = _name_tag(instance.get('Tags'))
+        print(f"{instance['InstanceId']:<20} {name_tag:<20} {instance['State']['Name']:<10} {instance.get('PublicIpAddress', 'N/A'):<15} {instance.get('PrivateIpAddress', 'N/A')}")
 
     # If theres no instances to delete - canceling the action
-    if not instances:
+    if not count:
         print(" No instances available for deletion.")
         return
 
-    # Show all the available instances to delete
-    print("\nAvailable instances to delete:")
-    print(f"{'Instance ID':<20} {'Name':<20} {'State':<10} {'Public IP':<15} {'Private IP'}")
-    print("=" * 80)
+    instance_names = input("Enter the instance name(s) or ID(s) to delete, separated by commas: ").split(",")
+    instance_names = [name.strip() for name in instance_names if name.strip()]
 
-    for instance in instances:
-        name_tag = next((tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'), "N/A") if instance.tags else "N/A"
-        print(f"{instance.id:<20} {name_tag:<20} {instance.state['Name']:<10} {str(instance.public_ip_address) if instance.public_ip_address else 'N/A':<15} {instance.private_ip_address}")
-
-
-    instance_name = input("Enter the instance name to delete: ").strip()
+    if not instance_names:
+        print("No instance selected. Termination cancelled.")
+        return
 
-    # Using the new function to find the appropriate instance.
-    instance = get_instance_by_name(ec2, instance_name)
+    # Using the new function to find the appropriate instance for every name, keeping each instance once.
+    instance_ids = []
+    for instance_name in instance_names:
+        instance = get_instance_by_name(instance_name)
 
-    if not instance:
-        return  # If no suitable instance is found, the operation is canceled.
+        if not instance:
+            return  # If no suitable instance is found, the operation is canceled.
 
-    instance_id = instance.id
+        if instance['InstanceId'] not in instance_ids:
+            instance_ids.append(instance['InstanceId'])
 
     # User deletion confirmation.
-    confirm = input(f"Are you sure you want to terminate instance {instance_id}? (y/N): ").strip().lower()
+    confirm = input(f"Are you sure you want to terminate instance {', '.join(instance_ids)}? (y/N): ").strip().lower()
     if confirm != "y":
         print("Termination cancelled.")
         return
 
+    terminate_instances(instance_ids)
+
+def terminate_instances(instance_ids):
+    """
+    Terminates the given instances with a single API request, without prompting the user.
+
+    :param instance_ids: The IDs of the instances to terminate
+    :return: True if the request succeeded, False otherwise.
+    """
+    instance_list = ", ".join(instance_ids)
+
     try:
-        print(f"Terminating instance {instance_id}...")
-        instance.terminate()
-        print(f"Instance {instance_id} has been terminated successfully.")
+        print(f"Terminating instance {instance_list}...")
+        _ec2_client().terminate_instances(InstanceIds=instance_ids)
+        print(f"Instance {instance_list} has been terminated successfully.")
+        return True
     except Exception as e:
-        print(f"Failed to terminate instance {instance_id}: {e}")
+        print(f"Failed to terminate instance {instance_list}: {e}")
+        return False
 
 #LIST OF ALL THE INSTANCES
 def list_cli_instances():
 
-    ec2 = boto3.resource('ec2', region_name=REGION_NAME)
+    # Search for all instances containing the 'Owner=' tag, writing each page of rows in one go as it arrives.
+    pages = _describe_instance_pages([
+        {'Name': 'tag:CreatedBy', 'Values': [OWNER_NAME]},
+        {'Name': 'instance-state-name', 'Values': _ACTIVE_STATES}
+    ])
+    count = 0
 
-    # Search for all instances containing the 'Owner=' tag.
-    instances = list(ec2.instances.filter(
-        Filters=[{'Name': 'tag:CreatedBy', 'Values': [OWNER_NAME]}]
-    ))
+    for page in pages:
+        if not page:
+            continue
 
-    instances = [instance for instance in instances if instance.state['Name'] not in ["terminated", "shutting-down"]]
+        lines = []
+        if not count:
+            lines.append("Instances created via CLI:\n")
+            lines.append(f"{'Instance ID':<20} {'State':<12} {'Public IP':<15} {'Private IP':<15} {'Name':<20}")
+            lines.append("-" * 80)
 
-    if not instances:
-        print("No instances found that were created using the CLI.")
-        return
+        for instance in page:
+            instance_id = instance['InstanceId']
+            state = instance['State']['Name']
+            public_ip = instance.get('PublicIpAddress', "N/A")
+            private_ip = instance.get('PrivateIpAddress', "N/A")
 
-    print(f"Found {len(instances)} instances created via CLI:\n")
-    print(f"{'Instance ID':<20} {'State':<12} {'Public IP':<15} {'Private IP':<15} {'Name':<20}")
+            # Retrieving the instance name from tags (if available).
+            name_tag = _name_tag(instance.get('Tags'), "Unnamed")
 
-    print("-" * 80)
+            lines.append(f"{instance_id:<20} {state:<12} {public_ip:<15} {private_ip:<15} {name_tag:<20}")
 
-    for instance in instances:
-        instance_id = instance.id
-        state = instance.state['Name']
-        public_ip = instance.public_ip_address if instance.public_ip_address else "N/A"
-        private_ip = instance.private_ip_address if instance.private_ip_address else "N/A"
+        count += len(page)
+        write_lines(lines)
 
-        # Retrieving the instance name from tags (if available).
-        name_tag = next((tag['Value'] for tag in instance.tags if tag['Key'] == 'Name'), "Unnamed")
+    if not count:
+        print("No instances found that were created using the CLI.")
+        return
 
-        print(f"{instance_id:<20} {state:<12} {public_ip:<15} {private_ip:<15} {name_tag:<20}")
+    print(f"\nFound {count} instances created via CLI.")
 
 
 
-def main():
-    ACTION_MAP = {
-        "1": manage_ec2_instance,
-        "2": delete_instance,
-        "3": create_ec2_instance,
-        "4": list_cli_instances
-    }
+_ACTION_MAP = {
+    "1": manage_ec2_instance,
+    "2": delete_instance,
+    "3": create_ec2_instance,
+    "4": list_cli_instances
+}
 
-    while True:  # Loop until valid value
-        user_action_choice = input(
-"""\nBefore we start, tell me what you want to do with EC2:
+_MENU_PROMPT = """\nBefore we start, tell me what you want to do with EC2:
 1. Manage an instance (start/stop)
 2. Delete an instance
 3. Create a new instance
 4. List all instances
-\nEnter your choice (1-4): """)
+\nEnter your choice (1-4): """
 
-        if user_action_choice in ACTION_MAP:
-            ACTION_MAP[user_action_choice]()  # Calling the appropriate function.
+def main():
+    while True:  # Loop until valid value
+        action = _ACTION_MAP.get(input(_MENU_PROMPT))
+
+        if action:
+            action()  # Calling the appropriate function.
             break  # Exit the function after the action
         else:
             print("Invalid choice. Please enter a number between 1 and 4.")
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,12 @@
+import sys
+
+def write_lines(lines):
+    """
+    Writes a block of lines to stdout with a single write instead of one print per line.
+    Used by the EC2, S3 and Route 53 modules for menus and tables.
+
+    :param lines: Any iterable of strings (a list or a generator); nothing is written when it is empty.
+    """
+    lines = list(lines)
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
@@ -1,45 +1,398 @@
-import boto3
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import itertools
+import re
+import time
+import uuid
 from resources.config import *
+from resources.session import get_session
+from resources.output import write_lines
 import botocore
+import botocore.config
+
+# Route 53 allows 5 requests per second per account; adaptive retries back off when it throttles us
+_CLIENT_CONFIG = botocore.config.Config(retries={'mode': 'adaptive', 'max_attempts': 10})
+
+@functools.lru_cache(maxsize=1)
+def _r53():
+    """
+    Returns the Route 53 client shared by every function in this module.
+    The client is built from the shared session on first use, so the service model is loaded once per run.
+    """
+    return get_session().client('route53', config=_CLIENT_CONFIG)
+
+# TLDs offered when creating a zone, and the numbered menu shown for them
+_TLDS = (".com", ".net", ".org", ".info", ".io", ".co", ".tech", ".ai")
+_TLD_MENU = "\n".join(f"{idx}. {tld}" for idx, tld in enumerate(_TLDS, 1))
+
+# A single DNS label, as accepted for a record name relative to its zone ('*' for a wildcard record)
+_LABEL_PATTERN = re.compile(r'^(?:\*|[a-z0-9_-]+)$', re.IGNORECASE)
+
+# The records type
+_VALID_RECORD_TYPES = frozenset({"A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "PTR", "SOA"})
+
+# Number of DNS records shown (and fetched) per screen
+_RECORD_PAGE_SIZE = 100
+
+# Hosted Zones listed during this session, reused for _ZONES_TTL seconds so consecutive actions don't list them again
+_ZONES_TTL = 30
+_zones_cache = {'zones': None, 'fetched_at': 0.0}
+
+# Whether each Hosted Zone (by ID) was created via the CLI, so tags are read once per session
+_cli_zone_cache = {}
 
 def is_cli_created_zone(zone_id, route53):
     """
     Checks if a Hosted Zone was created via the CLI.
 
     This function:
-    - Retrieves tags associated with the given Hosted Zone.
-    - Verifies whether the 'CreatedBy' tag is set to 'cli-meitaveini'.
+    - Looks the zone up in the tags already read this session (_cli_zone_cache), and only fetches
+      its tags through the batched _cli_zone_ids() lookup when it hasn't been seen before.
+    - Verifies whether the 'CreatedBy' tag is set to OWNER_NAME.
     - Returns True if the Hosted Zone was created via the CLI, otherwise returns False.
 
     This ensures that only Hosted Zones managed through the CLI can be modified 
     or deleted, preventing unintended changes to externally managed zones.
     """
-    try:
-        response = route53.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
-        for tag in response['ResourceTagSet']['Tags']:
-            if tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME:
-                return True
-    except route53.exceptions.ClientError:
-        pass
-    return False
+    return zone_id in _cli_zone_ids(route53, [zone_id])
 
-def get_domain_name():
+def _tag_map(tags):
     """
-    Checks if a given Route 53 DNS zone was created via the CLI.
+    Turns a Route 53 tag list into a {key: value} dictionary, so any tag can be read with a single lookup.
 
-    This function retrieves the tags associated with the specified Hosted Zone and verifies
-    whether it includes the 'CreatedBy' tag with the value 'cli-meitaveini'. This ensures that
-    only zones explicitly created through the CLI tool are recognized for further management.
+    :param tags: Tags as returned by ListTagsForResources (may be None).
+    """
+    return {tag.get('Key'): tag.get('Value') for tag in (tags or [])}
+
+def _cli_zone_ids(route53, zone_ids, max_workers=5):
+    """
+    Returns the IDs of the Hosted Zones created via the CLI among the given zone IDs.
 
-    Args:
-        zone_id (str): The ID of the DNS Hosted Zone to check.
-        route53 (boto3.client): The Route 53 client instance.
+    Tags are fetched with ListTagsForResources, which accepts up to 10 zones per request,
+    instead of one ListTagsForResource request per zone. When more than one request is needed,
+    the requests run concurrently on a small thread pool (boto3 clients are thread-safe).
+    Results are remembered in _cli_zone_cache, so only zones not seen before in this session are fetched.
+    Zones whose tags can't be read are not considered ours.
 
-    Returns:
-        bool: True if the Hosted Zone was created via the CLI, False otherwise.
+    :param route53: The boto3 client for AWS Route 53.
+    :param zone_ids: The IDs of the Hosted Zones to check.
+    :param max_workers: The maximum number of concurrent requests.
+    :return: A set with the IDs of the zones tagged 'CreatedBy' = OWNER_NAME.
+    """
+    def fetch_tag_sets(chunk):
+        try:
+            return route53.list_tags_for_resources(ResourceType='hostedzone', ResourceIds=chunk)['ResourceTagSets']
+        except route53.exceptions.ClientError:
+            return []
+
+    missing = [zone_id for zone_id in zone_ids if zone_id not in _cli_zone_cache]
+    chunks = [missing[start:start + 10] for start in range(0, len(missing), 10)]
+
+    if len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch_tag_sets, chunks))
+    else:
+        results = [fetch_tag_sets(chunk) for chunk in chunks]
+
+    for tag_sets in results:
+        for tag_set in tag_sets:
+            _cli_zone_cache[tag_set['ResourceId']] = _tag_map(tag_set['Tags']).get('CreatedBy') == OWNER_NAME
+
+    return {zone_id for zone_id in zone_ids if _cli_zone_cache.get(zone_id)}
+
+def _print_zone_menu(cli_zones):
+    """
+    Prints the numbered list of Hosted Zones the user selects from.
+
+    :param cli_zones: A list of (zone_id, zone_name) tuples.
+    """
+    write_lines(f"{idx}. {zone_name} (ID: {zone_id})" for idx, (zone_id, zone_name) in enumerate(cli_zones, 1))
+
+def _list_hosted_zones(route53):
+    """
+    Yields every Hosted Zone in the account, walking all ListHostedZones pages
+    (a single call returns at most 100 zones).
+
+    :param route53: The boto3 client for AWS Route 53.
+    :return: Generator of Hosted Zone dictionaries.
+    """
+    paginator = route53.get_paginator('list_hosted_zones')
+    for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+        yield from page['HostedZones']
+
+def _normalize_zone(zone):
+    """
+    Reduces a Hosted Zone dictionary to the short zone ID and the name without its trailing dot.
+
+    :param zone: A Hosted Zone as returned by ListHostedZones or CreateHostedZone.
+    :return: A (zone_id, zone_name) tuple, e.g. ('Z123ABC', 'example.com').
+    """
+    return zone['Id'].rsplit('/', 1)[-1], zone['Name'].rstrip('.')
+
+def _get_zones(route53, ttl=_ZONES_TTL):
+    """
+    Returns every Hosted Zone in the account, listing them again only when the cached list is older than `ttl` seconds.
+
+    :param route53: The boto3 client for AWS Route 53.
+    :param ttl: How long (in seconds) a fetched list is reused.
+    :return: A list of (zone_id, zone_name) tuples (see _normalize_zone).
+    """
+    now = time.monotonic()
+    if _zones_cache['zones'] is None or now - _zones_cache['fetched_at'] > ttl:
+        _zones_cache['zones'] = [_normalize_zone(zone) for zone in _list_hosted_zones(route53)]
+        _zones_cache['fetched_at'] = now
+    return _zones_cache['zones']
+
+def _invalidate_zones():
+    """
+    Drops the cached zone list, so the next _get_zones() call lists the zones again.
+    Called after a zone is created or deleted.
+    """
+    _zones_cache['zones'] = None
+
+def _filter_cli_zones(route53, zones):
+    """
+    Keeps only the Hosted Zones created via the CLI, checking their tags in batches.
+
+    :param route53: The boto3 client for AWS Route 53.
+    :param zones: (zone_id, zone_name) tuples, as returned by _get_zones.
+    :return: A list of (zone_id, zone_name) tuples for the CLI-created zones.
+    """
+    cli_zone_ids = _cli_zone_ids(route53, [zone_id for zone_id, zone_name in zones])
+    return [(zone_id, zone_name) for zone_id, zone_name in zones if zone_id in cli_zone_ids]
+
+def _decode_record_name(name):
+    """
+    Returns a record name as the user types it: Route 53 returns names in lowercase, with a wildcard '*' escaped as '\\052'.
+    """
+    return name.lower().replace('\\052', '*')
+
+def _find_record(route53, zone_id, zone_name, record_name, record_type):
+    """
+    Fetches a single DNS record by name and type without listing the whole zone.
+
+    ListResourceRecordSets returns records sorted by name and type, so starting the listing at
+    the requested name and type and asking for one item returns the record if it exists.
+
+    :param route53: The boto3 client for AWS Route 53.
+    :param zone_id: The ID of the Hosted Zone.
+    :param zone_name: The name of the Hosted Zone, appended to relative record names.
+    :param record_name: The record name (e.g. 'www' or 'www.example.com').
+    :param record_type: The record type (A, CNAME, MX, TXT, etc.).
+    :return: The record set, or None if the zone has no such record.
+    """
+    # Route 53 returns names in lowercase, so typed names are lowercased too
+    zone_name = zone_name.strip().lower().rstrip('.')
+    record_name = record_name.strip().lower().rstrip('.')
+    if record_name != zone_name and not record_name.endswith('.' + zone_name):
+        record_name = f"{record_name}.{zone_name}"
+    record_name += '.'
+
+    response = route53.list_resource_record_sets(
+        HostedZoneId=zone_id, StartRecordName=record_name, StartRecordType=record_type, MaxItems='1'
+    )
+    for record in response['ResourceRecordSets']:
+        if _decode_record_name(record['Name']) == record_name and record['Type'] == record_type:
+            return record
+    return None
+
+def _iter_records(route53, zone_id):
+    """
+    Yields every record in a Hosted Zone, fetching ListResourceRecordSets pages only as they are consumed.
+
+    :param route53: The boto3 client for AWS Route 53.
+    :param zone_id: The ID of the Hosted Zone.
+    :return: Iterator of record set dictionaries.
+    """
+    paginator = route53.get_paginator('list_resource_record_sets')
+    pages = paginator.paginate(HostedZoneId=zone_id, PaginationConfig={'PageSize': _RECORD_PAGE_SIZE})
+    return itertools.chain.from_iterable(page['ResourceRecordSets'] for page in pages)
+
+def _build_record_trie(records):
+    """
+    Indexes records by name in a trie keyed by reversed labels ('www.example.com.' -> com, example, www),
+    so the records at or below a name are found by walking its labels instead of comparing every record.
+    Wildcard names are indexed under '*' (see _decode_record_name), as the user types them.
+
+    :param records: Record sets, numbered from 1 in the order given.
+    :return: Nested dict; the "" key of a node holds the numbers of the records with exactly that name.
+    """
+    trie = {}
+    for idx, record in enumerate(records, 1):
+        node = trie
+        for label in reversed(_decode_record_name(record['Name']).rstrip('.').split('.')):
+            node = node.setdefault(label, {})
+        node.setdefault("", []).append(idx)
+    return trie
+
+def _records_under(trie, name):
+    """
+    Returns the numbers of the records named `name` or any name below it, in listing order.
+
+    :param trie: A trie from _build_record_trie.
+    :param name: A fully qualified name, e.g. 'api.example.com'.
+    """
+    node = trie
+    for label in reversed(name.lower().rstrip('.').split('.')):
+        node = node.get(label)
+        if node is None:
+            return []
+
+    matches, stack = [], [node]
+    while stack:
+        node = stack.pop()
+        for label, child in node.items():
+            if label == "":
+                matches.extend(child)
+            else:
+                stack.append(child)
+    return sorted(matches)
+
+def _select_record(records, zone_name, action, empty_message):
+    """
+    Shows records one screen at a time and lets the user pick one.
+    The next screen is only fetched when the user asks for it, and typing a name narrows
+    the records shown so far to that name and the names below it.
+    Names are entered like in create_dns_record: relative to the zone (e.g. 'api') or fully qualified.
+
+    :param records: Iterator of record sets (e.g. from _iter_records).
+    :param zone_name: The domain name of the zone the records belong to.
+    :param action: The verb used in the prompt ('update' or 'delete').
+    :param empty_message: Printed when there are no records to choose from.
+    :return: The selected record set, or None if there are none or the user cancelled.
+    """
+    shown = []
+    trie, trie_size = {}, 0
+
+    def record_line(idx, record):
+        return f"{idx}. {record['Name']} ({record['Type']}) - Value: {record['ResourceRecords'][0]['Value']} - TTL: {record['TTL']}"
+
+    def show_next_page():
+        page = list(itertools.islice(records, _RECORD_PAGE_SIZE))
+        write_lines(record_line(idx, record) for idx, record in enumerate(page, len(shown) + 1))
+        shown.extend(page)
+        return len(page) == _RECORD_PAGE_SIZE
+
+    has_more = show_next_page()
+    if not shown:
+        print(empty_message)
+        return None
+
+    while True:
+        more_hint = ", 'n' for more records" if has_more else ""
+        choice = input(f"\nSelect the record number to {action}{more_hint}, a name to filter by (or 'q' to cancel): ").strip().lower()
+        if choice == "q":
+            print("Operation cancelled.")
+            return None
+        if choice == "n" and has_more:
+            has_more = show_next_page()
+            continue
+        if choice.isdigit() and 1 <= int(choice) <= len(shown):
+            return shown[int(choice) - 1]
+        if choice and not choice.isdigit():
+            if trie_size != len(shown):  # Re-indexing only after more records were fetched
+                trie, trie_size = _build_record_trie(shown), len(shown)
+            # A relative name ('api', 'api.dev') is taken as a subdomain of the zone
+            name = _qualify_record_name(choice, zone_name) or f"{choice.rstrip('.')}.{zone_name}"
+            matches = _records_under(trie, name)
+            if not matches:
+                print(f"No records named '{choice}' (or below it) among the records shown.")
+            write_lines(record_line(idx, shown[idx - 1]) for idx in matches)
+            continue
+        print("Invalid choice. Please enter a valid number.")
+
+@functools.lru_cache(maxsize=None)
+def _zone_name_pattern(zone_name):
+    """
+    Returns the compiled pattern for record names inside a zone (valid labels, ending with the zone name).
+    A wildcard record ('*.' as the leftmost label) is accepted as well.
+    """
+    return re.compile(rf'^(?:\*\.)?(?:[a-z0-9_-]+\.)*{re.escape(zone_name)}\.?$', re.IGNORECASE)
+
+def _qualify_record_name(record_name, zone_name):
+    """
+    Turns a record name as entered by the user into a fully qualified name inside the zone.
+    An empty name means the zone itself, and a single label is taken as a subdomain of the zone.
+
+    :return: The full record name, or None if the name is not valid inside the zone.
+    """
+    record_name = record_name.strip().lower()
+
+    if not record_name:
+        return zone_name  # If empty, use the main domain name.
+    if _zone_name_pattern(zone_name).match(record_name):
+        return record_name  # The name is valid
+    if _LABEL_PATTERN.match(record_name):
+        return f"{record_name}.{zone_name}"  # Adding the main domain if the user entered only a subdomain.
+    return None
+
+def get_cli_zone(zone_name):
+    """
+    Finds a Hosted Zone created via the CLI by its domain name.
+
+    :param zone_name: The domain name of the zone (e.g. 'example.com').
+    :return: A (zone_id, zone_name) tuple, or None if no CLI-created zone has that name.
+    """
+    route53 = _r53()
+    zone_name = zone_name.strip().lower().rstrip('.')
+
+    # Only the zones with that name need their tags checked
+    matches = (zone for zone in _get_zones(route53) if zone[1] == zone_name)
+    return next((zone for zone in matches if is_cli_created_zone(zone[0], route53)), None)
+
+def upsert_dns_record(zone_id, zone_name, record_name, record_type, record_value, ttl=300):
     """
-    tlds = [".com", ".net", ".org", ".info", ".io", ".co", ".tech", ".ai"]
+    Creates a DNS record, or updates it if it already exists, in the given Hosted Zone.
+    Used by the interactive create_dns_record() and by the route53-create-record command.
+
+    :param zone_id: The ID of the Hosted Zone.
+    :param zone_name: The name of the Hosted Zone.
+    :param record_name: The record name, relative to the zone or fully qualified ('' for the zone itself).
+    :param record_type: The record type (A, CNAME, MX, TXT, etc.).
+    :param record_value: The record value; TXT values are quoted if needed.
+    :param ttl: The TTL in seconds.
+    :return: True if the record was written, False otherwise.
+    """
+    full_record_name = _qualify_record_name(record_name, zone_name)
+    if not full_record_name:
+        print(f"Invalid record name. It must be within '{zone_name}'.")
+        return False
+
+    record_type = record_type.upper()
+    if record_type not in _VALID_RECORD_TYPES:
+        print(f"Invalid record type. Supported types: {', '.join(sorted(_VALID_RECORD_TYPES))}")
+        return False
 
+    if record_type == "TXT" and not (record_value.startswith('"') and record_value.endswith('"')):
+        record_value = f'"{record_value}"'  # Adding quotation marks in case of a TXT record.
+
+    change_batch = {
+        'Changes': [{
+            'Action': 'UPSERT',
+            'ResourceRecordSet': {
+                'Name': full_record_name,
+                'Type': record_type,
+                'TTL': ttl,
+                'ResourceRecords': [{'Value': record_value}]
+            }
+        }]
+    }
+
+    try:
+        _r53().change_resource_record_sets(HostedZoneId=zone_id, ChangeBatch=change_batch)
+        print(f"DNS record '{full_record_name}' ({record_type}) has been created successfully in zone {zone_name}.")
+        return True
+    except Exception as e:
+        print(f"Failed to create DNS record: {e}")
+        return False
+
+def get_domain_name():
+    """
+    Asks the user for a domain name and a TLD from the supported list.
+
+    Returns:
+        str: The full domain name (e.g. 'example.com'), or None if the user cancelled.
+    """
     while True:
         domain_name = input("Enter the domain name (without TLD) or 'q' to quit: ").strip()
 
@@ -52,8 +405,7 @@ def get_domain_name():
             continue
 
         print("\nSelect a TLD from the following options:")
-        for idx, tld in enumerate(tlds, 1):
-            print(f"{idx}. {tld}")
+        print(_TLD_MENU)
 
         while True:
             tld_choice = input("\nEnter the number of your chosen TLD or 'q' to cancel: ").strip()
@@ -62,8 +414,8 @@ def get_domain_name():
                 print("Exiting domain selection.")
                 return None
 
-            if tld_choice.isdigit() and 1 <= int(tld_choice) <= len(tlds):
-                full_domain_name = domain_name + tlds[int(tld_choice) - 1]
+            if tld_choice.isdigit() and 1 <= int(tld_choice) <= len(_TLDS):
+                full_domain_name = domain_name + _TLDS[int(tld_choice) - 1]
                 print(f"Selected domain: {full_domain_name}")
                 return full_domain_name
             else:
@@ -88,31 +440,25 @@ def create_dns_zone():
         None
     """
 
-    route53 = boto3.client('route53')
-    
+    route53 = _r53()
+    existing_names = set()  # Domains already found to exist, so asking for them again doesn't call the API
+
     while True:
         domain_name = get_domain_name()  # Asks the user for a domain name with an extension
 
         if not domain_name:
             return  # If the user want to exit no need to continue
 
+        # A new CallerReference for each chosen domain; throttled requests are retried by the client with the same one
+        caller_reference = f"{OWNER_NAME}-{uuid.uuid4()}"
+        hosted_zone_id = None
+
         try:
-            # Checking if the domain exist
-            existing_zones = route53.list_hosted_zones()['HostedZones']
-            if any(zone['Name'].rstrip('.') == domain_name for zone in existing_zones):
+            hosted_zone_id = _create_zone(route53, domain_name, caller_reference, existing_names)
+            if hosted_zone_id is None:
                 print(f"The domain '{domain_name}' already exists. Please choose a different name or enter 'q' to exit.")
                 continue  # Loop back to enter a new name
 
-
-            #  Creating the - Hosted Zone
-            response = route53.create_hosted_zone(
-                Name=domain_name,
-                CallerReference=str(hash(domain_name)),
-                HostedZoneConfig={'Comment': 'Created via CLI', 'PrivateZone': False}
-            )
-
-            hosted_zone_id = response['HostedZone']['Id'].split('/')[-1]
-
             # Adding a tag to indicate that the Hosted Zone was created via the CLI
             route53.change_tags_for_resource(
                 ResourceType='hostedzone',
@@ -120,11 +466,48 @@ def create_dns_zone():
                 AddTags=[{'Key': 'CreatedBy', 'Value': OWNER_NAME}]
             )
 
+            _invalidate_zones()
             print(f"DNS zone '{domain_name}' created successfully with ID {hosted_zone_id}.")
             return  # Exit the function if successful
 
         except botocore.exceptions.ClientError as e:
+            if hosted_zone_id is not None:
+                _invalidate_zones()
+                print(f"DNS zone '{domain_name}' was created with ID {hosted_zone_id}, but tagging it failed: {e}")
+                return
+
             print(f"Failed to create DNS zone: {e}")
+            return
+
+def _create_zone(route53, domain_name, caller_reference, existing_names):
+    """
+    Creates the Hosted Zone for a domain unless a zone with that name already exists.
+
+    :param route53: The boto3 client for AWS Route 53.
+    :param domain_name: The domain name of the new zone.
+    :param caller_reference: The CallerReference sent with CreateHostedZone (the same one on retries).
+    :param existing_names: Domains already found to exist; updated when the domain is taken.
+    :return: The ID of the new zone, or None if the domain already exists.
+    """
+    # Checking if the domain exist (zones are listed by name, so the first result is the only candidate)
+    if domain_name not in existing_names:
+        existing_zones = route53.list_hosted_zones_by_name(DNSName=domain_name + '.', MaxItems='1')['HostedZones']
+        if existing_zones and existing_zones[0]['Name'].rstrip('.') == domain_name:
+            existing_names.add(domain_name)
+
+    if domain_name in existing_names:
+        return None
+
+    #  Creating the - Hosted Zone
+    # Retries send the same CallerReference, so a retried request can't create a second zone
+    response = route53.create_hosted_zone(
+        Name=domain_name,
+        CallerReference=caller_reference,
+        HostedZoneConfig={'Comment': 'Created via CLI', 'PrivateZone': False}
+    )
+
+    hosted_zone_id, _ = _normalize_zone(response['HostedZone'])
+    return hosted_zone_id
 
 def delete_dns_zone():
     """
@@ -136,15 +519,10 @@ def delete_dns_zone():
     
     The function follows best practices by validating user input and preventing accidental deletions.
     """
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     # Fetching all zones created via the CLI
-    response = route53.list_hosted_zones()
-    cli_zones = [
-        (zone['Id'].split('/')[-1], zone['Name'])
-        for zone in response['HostedZones']
-        if is_cli_created_zone(zone['Id'].split('/')[-1], route53)
-    ]
+    cli_zones = _filter_cli_zones(route53, _get_zones(route53))
 
     if not cli_zones:
         print("No CLI-created DNS zones found.")
@@ -152,8 +530,7 @@ def delete_dns_zone():
 
     # Displaying a list of Zones for selection
     print("\nAvailable DNS Zones for Deletion:")
-    for idx, (zone_id, zone_name) in enumerate(cli_zones, 1):
-        print(f"{idx}. {zone_name} (ID: {zone_id})")
+    _print_zone_menu(cli_zones)
 
     while True:
         choice = input("\nSelect the DNS Zone number to delete (or 'q' to cancel): ").strip().lower()
@@ -171,36 +548,35 @@ def delete_dns_zone():
             print("Invalid input. Please enter a number.")
 
     # Checking if the Zone contains records other than NS and SOA.
-    record_sets = route53.list_resource_record_sets(HostedZoneId=selected_zone_id)['ResourceRecordSets']
-    deletable_records = [record for record in record_sets if record['Type'] not in ["NS", "SOA"]]
+    deletable_records = [record for record in _iter_records(route53, selected_zone_id) if record['Type'] not in ["NS", "SOA"]]
 
     if deletable_records:
         print(f"\nThe DNS Zone '{selected_zone_name}' contains additional records that must be deleted before removing the zone.")
         print("You must delete these records first:")
-        for record in deletable_records:
-            print(f"- {record['Name']} ({record['Type']}) - {record['ResourceRecords'][0]['Value']}")
+        write_lines(
+            f"- {record['Name']} ({record['Type']}) - {record['ResourceRecords'][0]['Value']}"
+            for record in deletable_records
+        )
 
         confirm_delete_records = input("Do you want to delete all records in this zone? (y/N): ").strip().lower()
         if confirm_delete_records != "y":
             print("Zone deletion cancelled. Please delete the records manually before retrying.")
             return
         
-        # Deleting all non-default records.
-        for record in deletable_records:
+        # Deleting all non-default records, up to 1000 changes per request (each batch is applied atomically).
+        for start in range(0, len(deletable_records), 1000):
+            batch = deletable_records[start:start + 1000]
             try:
                 route53.change_resource_record_sets(
                     HostedZoneId=selected_zone_id,
                     ChangeBatch={
-                        'Changes': [{
-                            'Action': 'DELETE',
-                            'ResourceRecordSet': record
-                        }]
+                        'Changes': [{'Action': 'DELETE', 'ResourceRecordSet': record} for record in batch]
                     }
                 )
-                print(f"Deleted record: {record['Name']} ({record['Type']})")
             except Exception as e:
-                print(f"Failed to delete record {record['Name']}: {e}")
+                print(f"Failed to delete records: {e}")
                 return
+            write_lines(f"Deleted record: {record['Name']} ({record['Type']})" for record in batch)
 
     # Confirmation for deleting the Zone.
     confirm = input(f"Are you sure you want to delete the DNS Zone '{selected_zone_name}'? (y/N): ").strip().lower()
@@ -211,28 +587,11 @@ def delete_dns_zone():
     # Deleting the Zone.
     try:
         route53.delete_hosted_zone(Id=selected_zone_id)
+        _invalidate_zones()
         print(f"DNS Zone '{selected_zone_name}' has been deleted successfully.")
     except Exception as e:
         print(f"Failed to delete DNS zone: {e}")
 
-def is_cli_created_zone(zone_id, route53):
-    """
-    Checks if a DNS Zone (Hosted Zone) was created via the CLI by verifying the presence of a specific tag.
-
-    :param zone_id: The ID of the Hosted Zone to check.
-    :param route53: The boto3 client for AWS Route 53.
-    :return: True if the zone was created via the CLI (based on the 'CreatedBy' tag), otherwise False.
-    """
-    try:
-        response = route53.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
-        for tag in response['ResourceTagSet']['Tags']:
-            if tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME:
-                return True
-    except route53.exceptions.ClientError:
-        pass
-    return False
-
-
 def manage_dns_record():
     """
     Manages DNS records within a Hosted Zone created via the CLI.
@@ -256,8 +615,7 @@ def manage_dns_record():
 
     while True:
         print("\nChoose a DNS Record Action:")
-        for key, value in actions.items():
-            print(f"{key}. {value}")
+        write_lines(f"{key}. {value}" for key, value in actions.items())
 
         choice = input("\nEnter your choice (1-4): ").strip()
 
@@ -286,23 +644,17 @@ def create_dns_record():
     The function only permits record creation within Hosted Zones that have the 
     'CreatedBy' tag set to 'cli-meitaveini', ensuring control over managed records.
     """
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     # Retrieving DNS zones created via the CLI
-    response = route53.list_hosted_zones()
-    cli_zones = [
-        (zone['Id'].split('/')[-1], zone['Name'].rstrip('.'))
-        for zone in response['HostedZones']
-        if is_cli_created_zone(zone['Id'].split('/')[-1], route53)
-    ]
+    cli_zones = _filter_cli_zones(route53, _get_zones(route53))
 
     if not cli_zones:
         print("No CLI-created DNS zones found.")
         return
 
     print("\nAvailable DNS Zones (created via CLI):")
-    for idx, (zone_id, zone_name) in enumerate(cli_zones, 1):
-        print(f"{idx}. {zone_name} (ID: {zone_id})")
+    _print_zone_menu(cli_zones)
 
     # Choosing DNS zone
     while True:
@@ -320,38 +672,29 @@ def create_dns_record():
         except ValueError:
             print("Invalid input. Please enter a number.")
 
-    # Receiving the record name and validating its correctness.
+    # Receiving the record name and validating its correctness (valid labels, inside the selected zone).
     while True:
-        record_name = input(f"Enter the record name (subdomain for {selected_zone_name}, or leave empty for root): ").strip().lower()
-        
-        if not record_name:
-            record_name = selected_zone_name  # If empty, use the main domain name.
+        record_name = _qualify_record_name(
+            input(f"Enter the record name (subdomain for {selected_zone_name}, or leave empty for root): "),
+            selected_zone_name
+        )
+        if record_name:
             break
-        elif record_name.endswith(selected_zone_name):
-            break  # The name is valid
-        elif "." not in record_name:
-            record_name = f"{record_name}.{selected_zone_name}"  # Adding the main domain if the user entered only a subdomain.
-            break
-        else:
-            print(f"Invalid record name. It must be within '{selected_zone_name}'.")
-
-    valid_record_types = {"A", "AAAA", "CNAME", "MX", "TXT", "SRV", "NS", "PTR", "SOA"} # The records type
+        print(f"Invalid record name. It must be within '{selected_zone_name}'.")
 
     while True:
         record_type = input("Enter the record type (A, CNAME, MX, TXT, etc.) or 'q' to cancel: ").strip().upper()
         if record_type == "Q":
             print("Operation cancelled.")
             return
-        if record_type in valid_record_types:
+        if record_type in _VALID_RECORD_TYPES:
             break
-        print(f"Invalid record type. Supported types: {', '.join(valid_record_types)}")
+        print(f"Invalid record type. Supported types: {', '.join(sorted(_VALID_RECORD_TYPES))}")
 
 
     while True:
         record_value = input("Enter the record value: ").strip()
         if record_value:
-            if record_type == "TXT" and not (record_value.startswith('"') and record_value.endswith('"')):
-                record_value = f'"{record_value}"'  # Adding quotation marks in case of a TXT record.
             break
         else:
             print("Record value cannot be empty. Please enter a value.")
@@ -359,23 +702,7 @@ def create_dns_record():
     ttl = input("Enter the TTL (Time To Live) in seconds (default 300): ").strip()
     ttl = int(ttl) if ttl.isdigit() else 300  # Default to 300 if the user does not provide a TTL.
 
-    change_batch = {
-        'Changes': [{
-            'Action': 'UPSERT',
-            'ResourceRecordSet': {
-                'Name': record_name,
-                'Type': record_type,
-                'TTL': ttl,
-                'ResourceRecords': [{'Value': record_value}]
-            }
-        }]
-    }
-
-    try:
-        route53.change_resource_record_sets(HostedZoneId=selected_zone_id, ChangeBatch=change_batch)
-        print(f"DNS record '{record_name}' ({record_type}) has been created successfully in zone {selected_zone_name}.")
-    except Exception as e:
-        print(f"Failed to create DNS record: {e}")
+    upsert_dns_record(selected_zone_id, selected_zone_name, record_name, record_type, record_value, ttl)
 
 
 def update_dns_record():
@@ -394,23 +721,17 @@ def update_dns_record():
     The function ensures that only records within CLI-created zones 
     (identified by the 'CreatedBy' tag) can be modified.
     """
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     # Retrieving all Hosted Zones that were created via the CLI.
-    response = route53.list_hosted_zones()
-    cli_zones = [
-        (zone['Id'].split('/')[-1], zone['Name'])
-        for zone in response['HostedZones']
-        if is_cli_created_zone(zone['Id'].split('/')[-1], route53)
-    ]
+    cli_zones = _filter_cli_zones(route53, _get_zones(route53))
 
     if not cli_zones:
         print("No DNS zones created via CLI were found.")
         return
 
     print("\nAvailable DNS Zones (created via CLI):")
-    for idx, (zone_id, zone_name) in enumerate(cli_zones, 1):
-        print(f"{idx}. {zone_name} (ID: {zone_id})")
+    _print_zone_menu(cli_zones)
 
     # Retrieving the user's selection.
     while True:
@@ -423,31 +744,33 @@ def update_dns_record():
             break
         print("Invalid choice. Please enter a valid number.")
 
-    # Retrieving existing DNS records.
-    try:
-        record_sets = route53.list_resource_record_sets(HostedZoneId=zone_id)['ResourceRecordSets']
-    except Exception as e:
-        print(f"Failed to retrieve DNS records: {e}")
-        return
-
-    if not record_sets:
-        print("No DNS records found in the selected zone.")
-        return
-
-    print("\nAvailable DNS Records:")
-    for idx, record in enumerate(record_sets, 1):
-        print(f"{idx}. {record['Name']} ({record['Type']}) - Value: {record['ResourceRecords'][0]['Value']} - TTL: {record['TTL']}")
-
-    # Selecting a record for update.
-    while True:
-        record_choice = input("\nSelect the record number to update (or 'q' to cancel): ").strip()
-        if record_choice.lower() == "q":
-            print("Operation cancelled.")
+    # Looking the record up directly when the user already knows it, instead of listing the whole zone.
+    known_name = input("\nEnter the record name to update (or press Enter to choose from the list): ").strip()
+    if known_name:
+        known_type = input("Enter the record type (A, CNAME, MX, TXT, etc.): ").strip().upper()
+        if known_type not in _VALID_RECORD_TYPES:
+            print(f"Invalid record type. Supported types: {', '.join(sorted(_VALID_RECORD_TYPES))}")
+            return
+        try:
+            selected_record = _find_record(route53, zone_id, zone_name, known_name, known_type)
+        except Exception as e:
+            print(f"Failed to retrieve DNS record: {e}")
+            return
+        if not selected_record:
+            print(f"No {known_type} record named '{known_name}' found in zone {zone_name}.")
+            return
+    else:
+        # Streaming existing DNS records one screen at a time.
+        print("\nAvailable DNS Records:")
+        try:
+            selected_record = _select_record(
+                _iter_records(route53, zone_id), zone_name, "update", "No DNS records found in the selected zone."
+            )
+        except Exception as e:
+            print(f"Failed to retrieve DNS records: {e}")
+            return
+        if not selected_record:
             return
-        if record_choice.isdigit() and 1 <= int(record_choice) <= len(record_sets):
-            selected_record = record_sets[int(record_choice) - 1]
-            break
-        print("Invalid choice. Please enter a valid number.")
 
     record_name = selected_record['Name']
     record_type = selected_record['Type']
@@ -502,23 +825,17 @@ def delete_dns_record():
     The function ensures that only DNS records within CLI-managed Hosted Zones (tagged with 
     'CreatedBy=cli-meitaveini') can be deleted, preventing unintended modifications.
     """
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     # Retrieving all Hosted Zones created via the CLI.
-    response = route53.list_hosted_zones()
-    cli_zones = [
-        (zone['Id'].split('/')[-1], zone['Name'])
-        for zone in response['HostedZones']
-        if is_cli_created_zone(zone['Id'].split('/')[-1], route53)
-    ]
+    cli_zones = _filter_cli_zones(route53, _get_zones(route53))
 
     if not cli_zones:
         print("No DNS zones created via CLI were found.")
         return
 
     print("\nAvailable DNS Zones (created via CLI):")
-    for idx, (zone_id, zone_name) in enumerate(cli_zones, 1):
-        print(f"{idx}. {zone_name} (ID: {zone_id})")
+    _print_zone_menu(cli_zones)
 
     while True:
         choice = input("\nSelect the DNS Zone number to delete a record from (or 'q' to cancel): ").strip().lower()
@@ -535,45 +852,40 @@ def delete_dns_record():
         except ValueError:
             print("Invalid input. Please enter a number.")
 
-    # Retrieving existing DNS records.
-    try:
-        record_sets = route53.list_resource_record_sets(HostedZoneId=zone_id)['ResourceRecordSets']
-    except Exception as e:
-        print(f"Failed to retrieve DNS records: {e}")
-        return
-
-    if not record_sets:
-        print("No DNS records found in the selected zone.")
-        return
-
-    print("\nAvailable DNS Records for Deletion:")
-    deletable_records = [
-        record for record in record_sets
-        if record['Type'] not in ["NS", "SOA"]  # Filtering records that cannot be deleted.
-    ]
-
-    if not deletable_records:
-        print("No deletable DNS records found in this zone.")
-        return
-
-    for idx, record in enumerate(deletable_records, 1):
-        print(f"{idx}. {record['Name']} ({record['Type']}) - Value: {record['ResourceRecords'][0]['Value']} - TTL: {record['TTL']}")
-
-    while True:
-        record_choice = input("\nSelect the record number to delete (or 'q' to cancel): ").strip().lower()
-        if record_choice == "q":
-            print("Operation cancelled.")
+    # Looking the record up directly when the user already knows it, instead of listing the whole zone.
+    known_name = input("\nEnter the record name to delete (or press Enter to choose from the list): ").strip()
+    if known_name:
+        known_type = input("Enter the record type (A, CNAME, MX, TXT, etc.): ").strip().upper()
+        if known_type not in _VALID_RECORD_TYPES:
+            print(f"Invalid record type. Supported types: {', '.join(sorted(_VALID_RECORD_TYPES))}")
+            return
+        if known_type in ["NS", "SOA"]:
+            print(f"{known_type} records cannot be deleted.")
             return
         try:
-            record_choice = int(record_choice)
-            if 1 <= record_choice <= len(deletable_records):
-                selected_record = deletable_records[record_choice - 1]
-                break
-            else:
-                print("Invalid selection. Please choose a valid number.")
-        except ValueError:
-            print("Invalid input. Please enter a number.")
-
+            selected_record = _find_record(route53, selected_zone_id, selected_zone_name, known_name, known_type)
+        except Exception as e:
+            print(f"Failed to retrieve DNS record: {e}")
+            return
+        if not selected_record:
+            print(f"No {known_type} record named '{known_name}' found in zone {selected_zone_name}.")
+            return
+    else:
+        # Streaming existing DNS records one screen at a time, without the records that cannot be deleted.
+        print("\nAvailable DNS Records for Deletion:")
+        deletable_records = (
+            record for record in _iter_records(route53, selected_zone_id)
+            if record['Type'] not in ["NS", "SOA"]
+        )
+        try:
+            selected_record = _select_record(
+                deletable_records, selected_zone_name, "delete", "No deletable DNS records found in this zone."
+            )
+        except Exception as e:
+            print(f"Failed to retrieve DNS records: {e}")
+            return
+        if not selected_record:
+            return
 
     record_name = selected_record['Name']
     record_type = selected_record['Type']
@@ -605,8 +917,8 @@ def delete_dns_record():
     }
 
     try:
-        route53.change_resource_record_sets(HostedZoneId=zone_id, ChangeBatch=change_batch)
-        print(f"DNS record '{record_name}' ({record_type}) deleted successfully from zone {zone_name}.")
+        route53.change_resource_record_sets(HostedZoneId=selected_zone_id, ChangeBatch=change_batch)
+        print(f"DNS record '{record_name}' ({record_type}) deleted successfully from zone {selected_zone_name}.")
     except Exception as e:
         print(f"Failed to delete DNS record: {e}")
 
@@ -624,12 +936,11 @@ def list_all_dns_zones():
     The function ensures that only CLI-managed zones are shown, maintaining clear visibility 
     of resources under the tool's control.
     """
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     try:
         # Retrieving all zones from Route 53.
-        response = route53.list_hosted_zones()
-        hosted_zones = response.get('HostedZones', [])
+        hosted_zones = _get_zones(route53)
 
         if not hosted_zones:
             print("No DNS zones found in Route 53.")
@@ -639,37 +950,18 @@ def list_all_dns_zones():
         print(f"{'Index':<6} {'Domain Name':<30} {'Zone ID':<25} {'CLI Created':<12}")
         print("=" * 80)
 
-        for idx, zone in enumerate(hosted_zones, 1):
-            zone_id = zone['Id'].split('/')[-1]
-            zone_name = zone['Name']
-            is_cli_created = "V" if is_cli_created_zone(zone_id, route53) else "X"
+        cli_zone_ids = _cli_zone_ids(route53, [zone_id for zone_id, zone_name in hosted_zones])
 
-            print(f"{idx:<6} {zone_name:<30} {zone_id:<25} {is_cli_created:<12}")
+        rows = []
+        for idx, (zone_id, zone_name) in enumerate(hosted_zones, 1):
+            is_cli_created = "V" if zone_id in cli_zone_ids else "X"
 
-    except Exception as e:
-        print(f"Failed to retrieve DNS zones: {e}")
+            rows.append(f"{idx:<6} {zone_name:<30} {zone_id:<25} {is_cli_created:<12}")
 
-def is_cli_created_zone(zone_id, route53):
-    """
-    Checks if a Hosted Zone was created via the CLI.
-
-    This function:
-    - Retrieves tags associated with the given Hosted Zone.
-    - Verifies whether the 'CreatedBy' tag is set to 'cli-meitaveini'.
-    - Returns True if the Hosted Zone was created via the CLI, otherwise returns False.
-
-    This ensures that only Hosted Zones managed through the CLI can be modified 
-    or deleted, preventing unintended changes to externally managed zones.
-    """
-    try:
-        response = route53.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
-        for tag in response['ResourceTagSet']['Tags']:
-            if tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME:
-                return True
-    except route53.exceptions.ClientError:
-        pass
-    return False
+        write_lines(rows)
 
+    except Exception as e:
+        print(f"Failed to retrieve DNS zones: {e}")
 
 def list_all_dns_records():
     """
@@ -686,23 +978,17 @@ def list_all_dns_records():
     """
 
 
-    route53 = boto3.client('route53')
+    route53 = _r53()
 
     # Retrieving all DNS Zones created via the CLI.
-    response = route53.list_hosted_zones()
-    cli_zones = [
-        (zone['Id'].split('/')[-1], zone['Name'])
-        for zone in response['HostedZones']
-        if is_cli_created_zone(zone['Id'].split('/')[-1], route53)
-    ]
+    cli_zones = _filter_cli_zones(route53, _get_zones(route53))
 
     if not cli_zones:
         print("No CLI-created DNS zones found.")
         return
 
     print("\nAvailable DNS Zones (created via CLI):")
-    for idx, (zone_id, zone_name) in enumerate(cli_zones, 1):
-        print(f"{idx}. {zone_name} (ID: {zone_id})")
+    _print_zone_menu(cli_zones)
 
     # Selecting a DNS zone to display its DNS records.
     while True:
@@ -722,51 +1008,40 @@ def list_all_dns_records():
             print("Invalid input. Please enter a number.")
 
     try:
-        # Retrieving all records in the selected DNS zone.
-        response = route53.list_resource_record_sets(HostedZoneId=selected_zone_id)
-        records = response.get('ResourceRecordSets', [])
+        # Streaming the records in the selected DNS zone, one screen at a time.
+        records = _iter_records(route53, selected_zone_id)
+        idx = 0
 
-        if not records:
-            print(f"No DNS records found in the selected zone.")
-            return
-
-        print(f"\nDNS Records for Zone ID {selected_zone_id}:")
-        print(f"{'Index':<6} {'Record Name':<30} {'Type':<10} {'TTL':<6} {'Value'}")
-        print("=" * 80)
-
-        for idx, record in enumerate(records, 1):
-            record_name = record['Name']
-            record_type = record['Type']
-            ttl = record.get('TTL', 'N/A')
-            values = ', '.join([r['Value'] for r in record.get('ResourceRecords', [])])
+        while True:
+            page = list(itertools.islice(records, _RECORD_PAGE_SIZE))
 
-            print(f"{idx:<6} {record_name:<30} {record_type:<10} {ttl:<6} {values}")
+            if not page and idx == 0:
+                print(f"No DNS records found in the selected zone.")
+                return
 
-    except Exception as e:
-        print(f"Failed to retrieve DNS records: {e}")
+            if idx == 0:
+                print(f"\nDNS Records for Zone ID {selected_zone_id}:")
+                print(f"{'Index':<6} {'Record Name':<30} {'Type':<10} {'TTL':<6} {'Value'}")
+                print("=" * 80)
 
-def is_cli_created_zone(zone_id, route53):
-    """
-    Checks if a Hosted Zone was created via the CLI.
+            rows = []
+            for idx, record in enumerate(page, idx + 1):
+                record_name = record['Name']
+                record_type = record['Type']
+                ttl = record.get('TTL', 'N/A')
+                values = ', '.join([r['Value'] for r in record.get('ResourceRecords', [])])
 
-    This function:
-    - Retrieves tags associated with the given Hosted Zone.
-    - Verifies whether the 'CreatedBy' tag is set to 'cli-meitaveini'.
-    - Returns True if the Hosted Zone was created via the CLI, otherwise returns False.
+                rows.append(f"{idx:<6} {record_name:<30} {record_type:<10} {ttl:<6} {values}")
 
-    This ensures that only Hosted Zones managed through the CLI can be modified 
-    or deleted, preventing unintended changes to externally managed zones.
-    """
+            write_lines(rows)
 
-    try:
-        response = route53.list_tags_for_resource(ResourceType='hostedzone', ResourceId=zone_id)
-        for tag in response['ResourceTagSet']['Tags']:
-            if tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME:
-                return True
-    except route53.exceptions.ClientError:
-        pass
-    return False
+            if len(page) < _RECORD_PAGE_SIZE:
+                return
+            if input("\nShow more records? (y/N): ").strip().lower() != "y":
+                return
 
+    except Exception as e:
+        print(f"Failed to retrieve DNS records: {e}")
 
 def main():
     """
@@ -783,6 +1058,9 @@ def main():
     maintaining security and consistency in operations.
     """
 
+    _cli_zone_cache.clear()  # Don't reuse tags or zones read by a previous session
+    _invalidate_zones()
+
     ACTION_MAP = {
         "1": create_dns_zone,
         "2": delete_dns_zone,
@@ -801,8 +1079,9 @@ def main():
 5. List all dns records
 \nEnter your choice (1-5): """)
 
-        if user_action_choice in ACTION_MAP:
-            ACTION_MAP[user_action_choice]()  # Call the appropriate function.
+        handler = ACTION_MAP.get(user_action_choice)
+        if handler is not None:
+            handler()  # Call the appropriate function.
             break  # Exit the loop after performing the action.
         else:
             print("Invalid choice. Please enter a number between 1 and 5.")
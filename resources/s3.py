@@ -1,9 +1,51 @@
-import boto3
-import os
+import pathlib
 import json
-import re
-import botocore
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import itertools
 from resources.config import *
+from resources.session import get_session
+from resources.output import write_lines
+
+# Status lines of the bulk upload/delete paths; formatting is skipped when INFO is disabled
+log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=1)
+def _s3():
+    """
+    Returns the S3 client shared by every function in this module.
+    The client is built from the shared session on first use, so its connection pool is reused across menu actions
+    and boto3/botocore are only imported once an S3 action runs.
+    """
+    import botocore.config
+
+    # A larger connection pool so concurrent S3 requests don't wait for a free connection
+    config = botocore.config.Config(max_pool_connections=32, retries={'max_attempts': 3, 'mode': 'standard'})
+    return get_session().client('s3', config=config)
+
+@functools.lru_cache(maxsize=1)
+def _transfer_config():
+    """
+    Returns the settings used for uploads: files over 8 MB are sent as 16 MB parts, up to 20 at a time
+    (the client's connection pool is larger than that, so parts don't wait for a connection).
+    boto3's transfer module is imported on first use, like boto3 itself in the shared session.
+    """
+    from boto3.s3.transfer import TransferConfig
+    return TransferConfig(
+        multipart_threshold=8 * 1024 * 1024,
+        multipart_chunksize=16 * 1024 * 1024,
+        max_concurrency=20,
+        use_threads=True
+    )
+
+# Lookup tables indexed by byte value: characters allowed in a bucket name, and the ones it may start and end with
+_ALLOWED = bytes(c in b"abcdefghijklmnopqrstuvwxyz0123456789.-" for c in range(256))
+_EDGE = bytes(c in b"abcdefghijklmnopqrstuvwxyz0123456789" for c in range(256))
+# Forbidden two-character sequences, keyed as (previous byte << 8 | byte), and the bytes of the reserved word 'aws'
+_FORBIDDEN_PAIRS = frozenset(a << 8 | b for a, b in (b"..", b".-", b"-.", b"s3"))
+_A, _W, _S = b"aws"
 
 # CHECKS IF THE NAME IS VALID
 def is_valid_bucket_name(bucket_name):
@@ -19,24 +61,75 @@ def is_valid_bucket_name(bucket_name):
     
     Returns True if the name is valid, otherwise False.
     """
-    if not (3 <= len(bucket_name) <= 63):
+    if not (3 <= len(bucket_name) <= 63) or not bucket_name.isascii():
         return False  # The name must be between 3 and 63 characters long.
-    
-    if not re.match(r'^[a-z0-9][a-z0-9.-]*[a-z0-9]$', bucket_name):
-        return False  # Validate that the characters are valid.
 
-    if '..' in bucket_name or '.-' in bucket_name or '-.' in bucket_name:
-        return False  # Consecutive dots or hyphens are not allowed.
-    
-    if bucket_name.startswith('xn--') or bucket_name.startswith('sthree-'):
+    name = bucket_name.encode('ascii')
+
+    if not (_EDGE[name[0]] and _EDGE[name[-1]]):
+        return False  # The name must start and end with a letter or a number.
+
+    if name.startswith((b'xn--', b'sthree-')):
         return False  # Names starting with IDN prefixes or AWS reserved names are not allowed.
-    
-    if 'aws' in bucket_name or 's3' in bucket_name:
-        return False  # The name must not contain 'aws' or 's3'.
 
-    
+    # Validating the characters and every forbidden sequence ("..", ".-", "-.", "s3", "aws") in a single pass.
+    prev2 = prev = 0
+    for c in name:
+        if not _ALLOWED[c]:
+            return False
+        if (prev << 8 | c) in _FORBIDDEN_PAIRS or (prev2 == _A and prev == _W and c == _S):
+            return False  # Consecutive dots or hyphens, 'aws' and 's3' are not allowed.
+        prev2, prev = prev, c
+
     return True  # If all conditions pass, the name is valid.
 
+#LISTS THE FILES IN A BUCKET
+
+def _iter_object_pages(s3, bucket_name):
+    """
+    Yields the keys stored in a bucket one ListObjectsV2 page (up to 1000 keys) at a time,
+    walking every page instead of stopping at the first 1000 keys.
+
+    :param s3: Boto3 S3 client object.
+    :param bucket_name: Name of the S3 bucket.
+    :return: Generator of lists of object keys.
+    """
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket_name, PaginationConfig={'PageSize': 1000}):
+        yield [obj['Key'] for obj in page.get('Contents', ())]
+
+#DELETES ALL THE FILES IN A BUCKET
+
+def _delete_all_objects(s3, bucket_name):
+    """
+    Deletes every object in a bucket with DeleteObjects, 1000 keys per request.
+
+    Object versions and delete markers are listed with ListObjectVersions, so versioned buckets end up
+    empty as well (objects in unversioned buckets are listed with the version 'null').
+
+    :param s3: Boto3 S3 client object.
+    :param bucket_name: Name of the S3 bucket to empty.
+    :return: The number of deleted objects.
+    """
+    paginator = s3.get_paginator('list_object_versions')
+    objects = (
+        {'Key': version['Key'], 'VersionId': version['VersionId']}
+        for page in paginator.paginate(Bucket=bucket_name)
+        for version in itertools.chain(page.get('Versions', ()), page.get('DeleteMarkers', ()))
+    )
+
+    deleted = 0
+    while True:
+        chunk = list(itertools.islice(objects, 1000))
+        if not chunk:
+            return deleted
+
+        response = s3.delete_objects(Bucket=bucket_name, Delete={'Objects': chunk, 'Quiet': True})
+        errors = response.get('Errors', [])
+        if errors:
+            raise RuntimeError(f"{len(errors)} objects could not be deleted, e.g. '{errors[0]['Key']}': {errors[0]['Message']}")
+        deleted += len(chunk)
+
 #CHECKS IF THE BUCKET IS EMPTY
 
 def check_and_delete_files_in_bucket(s3, bucket_name):
@@ -46,37 +139,49 @@ def check_and_delete_files_in_bucket(s3, bucket_name):
     - Retrieves the list of objects stored in the specified bucket.
     - If the bucket is empty, notifies the user and exits.
     - If the bucket contains files, displays them as a numbered list.
-    - Prompts the user to select a file for deletion or exit the process.
+    - Prompts the user to select a file for deletion, 'all' to delete every file, or exit the process.
     - Allows the user to repeatedly delete files until they choose to exit.
 
     :param s3: Boto3 S3 client object.
     :param bucket_name: Name of the S3 bucket to check and manage files.
     """ 
     try:
-        response = s3.list_objects_v2(Bucket=bucket_name)
-        files = [obj['Key'] for obj in response.get('Contents', [])]
+        files = []
+
+        # Printing the keys page by page as they arrive
+        for keys in _iter_object_pages(s3, bucket_name):
+            if keys and not files:
+                print(f"\nBucket '{bucket_name}' contains the following files:")
+            if keys:
+                write_lines(f"{idx}. {file}" for idx, file in enumerate(keys, len(files) + 1))
+            files.extend(keys)
 
         if not files:
             print(f"The bucket '{bucket_name}' is empty.")
             return False  # No files in the bucket. Deletion is not required.
 
-        print(f"\nBucket '{bucket_name}' contains the following files:")
-        for idx, file in enumerate(files, 1):
-            print(f"{idx}. {file}")
-
         while True:
-            file_choice = input("\nEnter the file number to delete (or 'q' to cancel): ").strip()
+            file_choice = input("\nEnter the file number to delete, 'all' to delete every file (or 'q' to cancel): ").strip()
 
             if file_choice.lower() == 'q':
                 print("Operation cancelled. No files were deleted.")
                 return False  # The user choose to exit
 
+            if file_choice.lower() == 'all':
+                confirm = input(f"This will permanently delete every object in '{bucket_name}', including noncurrent versions and delete markers. Continue? (y/N): ").strip().lower()
+                if confirm != 'y':
+                    print("Operation cancelled. No files were deleted.")
+                    continue
+                deleted = _delete_all_objects(s3, bucket_name)
+                log.info("Deleted %d objects from bucket '%s'.", deleted, bucket_name)
+                return True
+
             try:
                 file_choice = int(file_choice)
                 if 1 <= file_choice <= len(files):
                     file_to_delete = files[file_choice - 1]
                     s3.delete_object(Bucket=bucket_name, Key=file_to_delete)
-                    print(f"File '{file_to_delete}' deleted successfully.")
+                    log.info("File '%s' deleted successfully.", file_to_delete)
                     return True  # The file deletes successfully:)
             except ValueError:
                 print("Invalid input. Please enter a valid file number or 'q' to cancel.")
@@ -106,9 +211,13 @@ def get_available_bucket_name(s3):
         try:
             s3.head_bucket(Bucket=bucket_name)
             print(f"The bucket name '{bucket_name}' is already taken. Try another name.")
-        except botocore.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == "404":  # The bucket not exist, can be used!!
+        except s3.exceptions.ClientError as e:
+            code = e.response['Error']['Code']
+            if code == "404":  # The bucket not exist, can be used!!
                 return bucket_name  
+            if code in ("403", "301"):  # The bucket exists in another account or region
+                print(f"The bucket name '{bucket_name}' is already taken. Try another name.")
+                continue
             print(f"AWS error: {e}")
 
 #CREATE A BUCKET
@@ -126,9 +235,8 @@ def create_s3_bucket():
     - Displays success or failure messages based on the outcome of the creation process.
     """
 
-    s3 = boto3.client("s3", region_name=REGION_NAME)
+    s3 = _s3()
 
-    bucket_name = input("Enter bucket name: ").strip()
     bucket_name = get_available_bucket_name(s3)  # Performs a check if the name is already taken, allowing the user to enter a new name.
 
     if not bucket_name:
@@ -139,6 +247,7 @@ def create_s3_bucket():
         # Setting public or private permissions
         access_type = input("Should the bucket be public or private? (public/private): ").strip().lower()
         response = s3.create_bucket(Bucket=bucket_name)
+        _list_cli_buckets.cache_clear()
         print(f"S3 Bucket '{bucket_name}' created successfully.")
 
         # ADDING TAG TO THE BUCKET
@@ -200,23 +309,19 @@ def upload_file_to_s3():
         None
     """
 
-    s3 = boto3.client('s3')
+    s3 = _s3()
 
     # Displaying all buckets created via the CLI
-    response = s3.list_buckets()
-    cli_buckets = [
-        bucket['Name'] for bucket in response['Buckets']
-        if is_cli_created_bucket(bucket['Name'], s3)
-    ]
+    cli_buckets = _list_cli_buckets(s3)
 
     if not cli_buckets:
         print("No available CLI-created S3 buckets found.")
         return
 
     print("\nAvailable S3 Buckets (created via CLI):")
-    for bucket in cli_buckets:
-        print(f"- {bucket}")
+    write_lines(f"- {bucket}" for bucket in cli_buckets)
 
+    cli_bucket_set = set(cli_buckets)
     while True:
         bucket_name = input("\nEnter the name of the S3 bucket to upload to (or 'q' to cancel): ").strip()
 
@@ -224,7 +329,7 @@ def upload_file_to_s3():
             print("Upload cancelled.")
             return  # Exit the function
 
-        if bucket_name in cli_buckets:
+        if bucket_name in cli_bucket_set:
             break  #  Exit the loop if the bucket name is valid
 
         print(f"Invalid bucket name. You can only upload to S3 buckets created via CLI. Try again or enter 'q' to exit.")
@@ -238,15 +343,18 @@ def upload_file_to_s3():
                 print("Upload cancelled.")
                 return  # Exit the function
 
-            if os.path.isfile(file_path):  # Check if the file exists
-                file_name = os.path.basename(file_path)  # Extract the file name from the path
+            path = pathlib.Path(file_path)
+
+            if path.is_file():  # Check if the file exists (a single stat)
+                file_name = path.name  # Extract the file name from the path
                 break  # Exit the loop if the file exists
 
             print("Invalid file path. File does not exist. Try again or enter 'q' to exit.")
 
         try:
-            s3.upload_file(file_path, bucket_name, file_name)
-            print(f"File '{file_name}' uploaded successfully to bucket '{bucket_name}'.")
+            # Uploading by path, so the transfer manager reads the parts in parallel instead of buffering them from one handle
+            s3.upload_file(str(path), bucket_name, file_name, Config=_transfer_config())
+            log.info("File '%s' uploaded successfully to bucket '%s'.", file_name, bucket_name)
         except Exception as e:
             print(f"Failed to upload file: {e}")
 
@@ -282,15 +390,81 @@ def is_cli_created_bucket(bucket_name, s3):
 
     try:
         response = s3.get_bucket_tagging(Bucket=bucket_name)
-        for tag in response['TagSet']:
-            if tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME:
-                return True
+        return any(tag['Key'] == "CreatedBy" and tag['Value'] == OWNER_NAME for tag in response['TagSet'])
     except s3.exceptions.ClientError:
-        pass  # If there are no tags or no permission, the bucket is not considered ours
+        return False  # If there are no tags or no permission, the bucket is not considered ours
+
+
+
+def _cli_bucket_names(s3, buckets, max_workers=16):
+    """
+    Returns the names of the buckets created via the CLI, keeping the order of the given list.
+
+    GetBucketTagging only accepts one bucket per request, so the requests run concurrently on a
+    thread pool (boto3 clients are thread-safe, and the client's pool has room for every worker).
+
+    :param s3: Boto3 S3 client object.
+    :param buckets: Buckets as returned by ListBuckets.
+    :param max_workers: The maximum number of concurrent requests.
+    :return: A list of bucket names.
+    """
+    names = [bucket['Name'] for bucket in buckets]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        created_by_cli = list(executor.map(lambda name: is_cli_created_bucket(name, s3), names))
+
+    return [name for name, is_ours in zip(names, created_by_cli) if is_ours]
+
+@functools.lru_cache(maxsize=1)
+def _tagging():
+    """
+    Returns the Resource Groups Tagging API client, built once from the shared session like the S3 client.
+    """
+    return get_session().client('resourcegroupstaggingapi')
+
+def _tagged_bucket_names():
+    """
+    Returns the names of the buckets tagged 'CreatedBy' = OWNER_NAME, using one paginated
+    Resource Groups Tagging API query instead of one GetBucketTagging request per bucket.
 
-    return False
+    :return: A set of bucket names.
+    """
+    paginator = _tagging().get_paginator('get_resources')
+    names = set()
+
+    for page in paginator.paginate(TagFilters=[{'Key': 'CreatedBy', 'Values': [OWNER_NAME]}], ResourceTypeFilters=['s3']):
+        for mapping in page['ResourceTagMappingList']:
+            names.add(mapping['ResourceARN'].split(':')[-1])  # arn:aws:s3:::bucket-name
 
+    return names
 
+def _cli_bucket_name_set(s3, buckets):
+    """
+    Returns the names of the given buckets that were created via the CLI.
+
+    The tags are read with a single tagging query; if that query isn't allowed, each bucket's tags are checked instead.
+
+    :param s3: Boto3 S3 client object.
+    :param buckets: Buckets as returned by ListBuckets.
+    :return: A set of bucket names.
+    """
+    try:
+        return _tagged_bucket_names()
+    except Exception:
+        return set(_cli_bucket_names(s3, buckets))  # e.g. no tag:GetResources permission
+
+@functools.lru_cache(maxsize=1)
+def _list_cli_buckets(s3):
+    """
+    Returns the names of the buckets created via the CLI, listing and checking them once per session.
+    The cache is cleared whenever a bucket is created or deleted.
+
+    :param s3: Boto3 S3 client object.
+    :return: A tuple of bucket names.
+    """
+    buckets = s3.list_buckets()['Buckets']
+    cli_bucket_set = _cli_bucket_name_set(s3, buckets)
+    return tuple(bucket['Name'] for bucket in buckets if bucket['Name'] in cli_bucket_set)
 
 def delete_s3_bucket():
     """
@@ -306,15 +480,11 @@ def delete_s3_bucket():
     If the user chooses to cancel at any stage, the function safely exits.
     """
 
-    s3 = boto3.client('s3')
+    s3 = _s3()
 
     #Retrieving all buckets created via the CLI
 
-    response = s3.list_buckets()
-    cli_buckets = [
-        bucket['Name'] for bucket in response['Buckets']
-        if is_cli_created_bucket(bucket['Name'], s3)
-    ]
+    cli_buckets = _list_cli_buckets(s3)
 
     #  IF THERES NOT AVAILABLE BUCKETS CANCELING THE ACTION
     if not cli_buckets:
@@ -324,11 +494,11 @@ def delete_s3_bucket():
     #  LIST ALL THE AVAILABLE BUCKETS TO DELETE
     print("\nAvailable S3 Buckets for Deletion:")
     print("=" * 40)
-    for bucket in cli_buckets:
-        print(f"- {bucket}")
+    write_lines(f"- {bucket}" for bucket in cli_buckets)
     print("=" * 40)
 
     #  GETS NAME TO DELETE
+    cli_bucket_set = set(cli_buckets)
     while True:
         bucket_name = input("Enter the S3 bucket name to delete (or 'q' to exit): ").strip()
 
@@ -336,9 +506,7 @@ def delete_s3_bucket():
             print("Bucket deletion cancelled.")
             return  
 
-        matching_buckets = [b for b in s3.list_buckets()["Buckets"] if b["Name"] == bucket_name]
-
-        if not matching_buckets:
+        if bucket_name not in cli_bucket_set:
             print(f"No S3 buckets found with name '{bucket_name}'. Please try again.")
         else:
             break  # Getting out of the function if the bucket name is valid
@@ -361,6 +529,7 @@ def delete_s3_bucket():
     try:
         print(f"Deleting bucket '{bucket_name}'...")
         s3.delete_bucket(Bucket=bucket_name)
+        _list_cli_buckets.cache_clear()
         print(f"Bucket '{bucket_name}' has been deleted successfully.")
     except Exception as e:
         print(f"Failed to delete bucket: {e}")
@@ -372,28 +541,28 @@ def list_s3_buckets():
     This function retrieves and displays all S3 buckets that were created via the CLI.
     It ensures that only relevant buckets are listed, filtering out those created by other methods.
     """
-    s3 = boto3.client("s3")
+    s3 = _s3()
 
     try:
-        response = s3.list_buckets()
-        buckets = response.get('Buckets', [])
+        buckets = s3.list_buckets().get('Buckets', ())
+        cli_bucket_set = _cli_bucket_name_set(s3, buckets)
+
+        rows = [
+            f"{bucket['Name']:<30} {bucket['CreationDate']}"
+            for bucket in buckets if bucket['Name'] in cli_bucket_set
+        ]
 
-        if not buckets:
-            print("No S3 buckets found.")
+        if not rows:
+            print("No S3 buckets created via CLI found.")
             return
 
-        print("\nAvailable S3 Buckets for deletion:")
+        print("\nS3 Buckets created via CLI:")
         print(f"{'Bucket Name':<30} {'Creation Date'}")
         print("=" * 50)
-
-        for bucket in buckets:
-            print(f"{bucket['Name']:<30} {bucket['CreationDate']}")
-
-        return buckets
+        write_lines(rows)
 
     except Exception as e:
         print(f"Failed to list buckets: {e}")
-        return []
 
 def main():
     """
@@ -418,12 +587,18 @@ def main():
 4. List cli buckets
 \nEnter your choice (1-4): """)
 
-        if user_action_choice in ACTION_MAP:
-            ACTION_MAP[user_action_choice]()  # Call the appropriate function.
+        handler = ACTION_MAP.get(user_action_choice)
+        if handler is not None:
+            handler()  # Call the appropriate function.
             break  # Exit from the loop after the action
         else:
             print("Invalid choice. Please enter a number between 1 and 4.")
 
 
 if __name__ == "__main__":
+    # Status lines go to stdout like the rest of the output; the root logger (and botocore's messages) is left alone
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
     main()
\ No newline at end of file
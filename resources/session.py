@@ -0,0 +1,15 @@
+import functools
+from resources.config import REGION_NAME
+
+@functools.lru_cache(maxsize=1)
+def get_session():
+    """
+    Returns the boto3 session shared by the EC2, S3 and Route 53 modules.
+
+    Credentials, region and the service model loaders are resolved once per CLI run
+    and reused by every client and resource built from this session.
+    boto3 is imported on first use, so importing this module stays cheap.
+    """
+    import boto3
+
+    return boto3.Session(region_name=REGION_NAME)
@@ -0,0 +1,14 @@
+from resources.route53 import _build_record_trie, _qualify_record_name, _records_under
+
+
+def _record(name):
+    return {'Name': name, 'Type': 'A', 'ResourceRecords': [{'Value': '192.0.2.1'}], 'TTL': 300}
+
+
+def test_records_under_finds_wildcard_record_by_typed_name():
+    # Route 53 returns wildcard names with the '*' escaped as '\052'
+    records = [_record('example.com.'), _record('\\052.example.com.'), _record('www.example.com.')]
+    trie = _build_record_trie(records)
+
+    assert _records_under(trie, _qualify_record_name('*', 'example.com')) == [2]
+    assert _records_under(trie, 'example.com') == [1, 2, 3]